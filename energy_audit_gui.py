@@ -7,14 +7,56 @@ Profesionálny desktop interface pre energetický audit systém
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import json
+import logging
+import concurrent.futures
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
 import os
 import sys
+import types
 from pathlib import Path
 
 # Pridanie src do path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
+# Tabuľka na nahradenie znakov nepovolených v názvoch súborov
+_FNAME_TABLE = str.maketrans({c: '_' for c in ' /\\:*?"<>|'})
+
+# Zdieľaný prázdny slovník len na čítanie (predvolená hodnota pre .get)
+_EMPTY = types.MappingProxyType({})
+
+# Formát riadku prvku obálky vo výsledkoch a reporte
+_ENV_FMT = "{name}: {area:.0f} m², U={u_value:.2f} W/m²K"
+
+
+@dataclass
+class EnvelopeElement:
+    """Prvok obálky budovy vo výsledkoch auditu"""
+    __slots__ = ('name', 'area', 'u_value', 'heat_loss')
+    name: str
+    area: float
+    u_value: float
+    heat_loss: float
+
+
+def _json_default(obj):
+    """Serializácia objektov, ktoré json nepozná"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def _write_bytes(filename, data):
+    """Zápis pripravených bajtov do súboru"""
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def _json_bytes(payload):
+    """Serializácia do JSON bajtov (v hlavnom vlákne - vlákno I/O nečíta živé údaje)"""
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+
+
 class EnergyAuditGUI:
     def __init__(self, root):
         self.root = root
@@ -27,6 +69,15 @@ class EnergyAuditGUI:
         self.audit_data = {}
         self.results = {}
         
+        # Revízia dát auditu - zvyšuje sa pri každej zmene audit_data/results
+        self._audit_rev = 0
+        self._render_ctx = (None, None)
+        self._last_report_rev = 0
+        
+        # Diskové operácie bežia mimo hlavného vlákna Tk
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='audit-io')
+        self._io_buttons = []
+        
         # Vytvorenie GUI
         self.create_widgets()
         self.create_status_bar()
@@ -49,6 +100,9 @@ class EnergyAuditGUI:
         self.create_results_tab()
         self.create_report_tab()
         
+        # Report sa generuje až pri prepnutí na jeho tab
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
         # Bottom panel s tlačidlami
         self.create_bottom_panel()
         
@@ -453,6 +507,8 @@ class EnergyAuditGUI:
                            font=('Arial', 10, 'bold'),
                            width=12, height=2)
             btn.pack(side=tk.LEFT, padx=3)
+            if command != self.load_project:
+                self._io_buttons.append(btn)
         
         # Exit tlačidlo vpravo
         exit_btn = tk.Button(button_frame, text="❌ UKONČIŤ",
@@ -482,6 +538,31 @@ class EnergyAuditGUI:
         self.status_label.config(bg=color)
         self.root.update()
         
+    def _run_io(self, task, args, on_success, error_message):
+        """Spustenie zápisu na pozadí, výsledok sa oznámi v hlavnom vlákne"""
+        for btn in self._io_buttons:
+            btn.config(state=tk.DISABLED)
+        
+        future = self._io_pool.submit(task, *args)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_io, f, on_success, error_message))
+    
+    def _finish_io(self, future, on_success, error_message):
+        """Dokončenie zápisu na pozadí"""
+        for btn in self._io_buttons:
+            btn.config(state=tk.NORMAL)
+        
+        error = future.exception()
+        if error is not None:
+            self._report_error(error_message, error)
+        else:
+            on_success()
+    
+    def _report_error(self, context, error):
+        """Zalogovanie chyby a jej zobrazenie používateľovi"""
+        logging.error(context, exc_info=error)
+        messagebox.showerror("Chyba", f"{context}: {error!r}")
+        
     def collect_data(self):
         """Zber dát z GUI"""
         try:
@@ -560,6 +641,7 @@ class EnergyAuditGUI:
                 'systems': systems_data,
                 'usage': usage_data
             }
+            self._audit_rev += 1
             
             return True
             
@@ -618,12 +700,12 @@ class EnergyAuditGUI:
             self.update_status("📈 Počítam tepelné straty obálky...", '#3498db')
             
             self.results = self.calculate_energy_performance()
+            self._audit_rev += 1
             
             self.progress['value'] = 80
             self.update_status("📄 Generujem výsledky a report...", '#3498db')
             
             self.display_results()
-            self.generate_report()
             
             self.progress['value'] = 100
             self.update_status("✅ Energetický audit úspešne dokončený!", '#27ae60')
@@ -646,19 +728,16 @@ class EnergyAuditGUI:
         results = {}
         
         # Výpočet tepelných strát obálkou
-        total_heat_loss = 0
-        envelope_details = []
-        
-        for construction in envelope_data['constructions']:
-            heat_loss = construction['area'] * construction['u_value']
-            total_heat_loss += heat_loss
-            
-            envelope_details.append({
-                'name': construction['name'],
-                'area': construction['area'],
-                'u_value': construction['u_value'],
-                'heat_loss': heat_loss
-            })
+        envelope_details = [
+            EnvelopeElement(
+                name=c['name'],
+                area=c['area'],
+                u_value=c['u_value'],
+                heat_loss=c['area'] * c['u_value']
+            )
+            for c in envelope_data['constructions']
+        ]
+        total_heat_loss = sum(d.heat_loss for d in envelope_details)
         
         results['envelope_analysis'] = {
             'total_heat_loss_coefficient': total_heat_loss,
@@ -777,14 +856,38 @@ class EnergyAuditGUI:
             'specific': total_co2 / building_data['heated_area']
         }
         
+        # Odporúčania sa počítajú raz pri výpočte, nie pri každom zobrazení
+        results['recommendations'] = self._compute_recommendations(results)
+        
         return results
     
-    def display_results(self):
+    def _build_render_context(self):
+        """Spoločné podklady pre zobrazenie výsledkov aj reportu"""
+        if self._render_ctx[0] == self._audit_rev:
+            return self._render_ctx[1]
+        
+        details = self.results['envelope_analysis']['details']
+        ctx = {
+            'building': self.audit_data['building'],
+            'results': self.results,
+            'details': details,
+            'env_rows': [_ENV_FMT.format_map(asdict(d)) for d in details]
+        }
+        self._render_ctx = (self._audit_rev, ctx)
+        return ctx
+    
+    def display_results(self, ctx=None):
         """Zobrazenie výsledkov"""
-        self.results_text.delete(1.0, tk.END)
-        
-        building = self.audit_data['building']
-        results = self.results
+        if ctx is None:
+            ctx = self._build_render_context()
+        building = ctx['building']
+        results = ctx['results']
+        ha = results['heating_analysis']
+        ec = results['energy_consumption']
+        pe = results['primary_energy']
+        co2 = results['co2_emissions']
+        cls = results['energy_class']
+        env = results['envelope_analysis']
         
         output = f"""
 {'='*80}
@@ -797,25 +900,25 @@ class EnergyAuditGUI:
 📅 Rok výstavby: {building['construction_year']}
 
 ⚡ ENERGETICKÁ BILANCIA:
-├─ Potreba tepla na vykurovanie: {results['heating_analysis']['net_heating_need']:.0f} kWh/rok
-├─ Spotreba na vykurovanie: {results['energy_consumption']['heating_energy']:.0f} kWh/rok
-├─ Spotreba na TUV: {results['energy_consumption']['dhw_energy']:.0f} kWh/rok
-├─ Elektrická energia: {results['energy_consumption']['electricity']:.0f} kWh/rok
-└─ Celková spotreba: {results['energy_consumption']['total_energy']:.0f} kWh/rok
+├─ Potreba tepla na vykurovanie: {ha['net_heating_need']:.0f} kWh/rok
+├─ Spotreba na vykurovanie: {ec['heating_energy']:.0f} kWh/rok
+├─ Spotreba na TUV: {ec['dhw_energy']:.0f} kWh/rok
+├─ Elektrická energia: {ec['electricity']:.0f} kWh/rok
+└─ Celková spotreba: {ec['total_energy']:.0f} kWh/rok
 
 🎯 ENERGETICKÉ HODNOTENIE:
-├─ Energetická trieda: {results['energy_class']['class']}
-├─ Primárna energia: {results['primary_energy']['specific']:.1f} kWh/m²rok
-├─ CO2 emisie: {results['co2_emissions']['specific']:.1f} kg CO2/m²rok
-└─ Špecifická spotreba: {results['energy_consumption']['specific_total']:.1f} kWh/m²rok
+├─ Energetická trieda: {cls['class']}
+├─ Primárna energia: {pe['specific']:.1f} kWh/m²rok
+├─ CO2 emisie: {co2['specific']:.1f} kg CO2/m²rok
+└─ Špecifická spotreba: {ec['specific_total']:.1f} kWh/m²rok
 
 🏠 OBÁLKA BUDOVY:
 """
         
-        for detail in results['envelope_analysis']['details']:
-            output += f"├─ {detail['name']}: {detail['area']:.0f} m², U={detail['u_value']:.2f} W/m²K\n"
+        for row in ctx['env_rows']:
+            output += f"├─ {row}\n"
         
-        output += f"└─ Celkový súčiniteľ prestupu: {results['envelope_analysis']['total_heat_loss_coefficient']:.1f} W/K\n"
+        output += f"└─ Celkový súčiniteľ prestupu: {env['total_heat_loss_coefficient']:.1f} W/K\n"
         
         # Odporúčania
         recommendations = self.generate_recommendations()
@@ -824,37 +927,51 @@ class EnergyAuditGUI:
             for i, rec in enumerate(recommendations[:3], 1):
                 output += f"{i}. {rec['title']} - {rec['estimated_savings']} úspory\n"
         
-        self.results_text.insert(tk.END, output)
+        # Jedna atomická zmena obsahu namiesto delete + insert
+        self.results_text.replace(1.0, tk.END, output)
         
         # Prepnúť na tab s výsledkami
         self.notebook.select(self.results_tab)
     
+    def _on_tab_changed(self, event=None):
+        """Vygenerovanie reportu pri zobrazení jeho tabu, ak sa dáta zmenili"""
+        if (self.results and self._last_report_rev != self._audit_rev
+                and self.notebook.select() == str(self.report_tab)):
+            self.generate_report()
+    
     def generate_recommendations(self):
-        """Generovanie odporúčaní"""
+        """Odporúčania k aktuálnym výsledkom (vypočítané raz s výsledkami auditu)"""
+        return self.results.get('recommendations', [])
+    
+    def _compute_recommendations(self, results):
+        """Generovanie odporúčaní z výsledkov výpočtu"""
+        if not results.get('envelope_analysis'):
+            return []
+        
         recommendations = []
-        results = self.results
-        
-        # Hodnotenie obálky
-        envelope = results['envelope_analysis']['details']
-        
-        for element in envelope:
-            if element['name'] == 'Obvodová stena' and element['u_value'] > 0.30:
-                recommendations.append({
-                    'category': 'Tepelná izolácia',
-                    'title': 'Zateplenie obvodových stien',
-                    'description': f'Aktuálna U-hodnota {element["u_value"]:.2f} W/m²K je vysoká.',
-                    'priority': 'Vysoká',
-                    'estimated_savings': '25-35%'
-                })
-                
-            if element['name'] == 'Okná' and element['u_value'] > 2.0:
-                recommendations.append({
-                    'category': 'Výplne otvorov',
-                    'title': 'Výmena okien',
-                    'description': f'Aktuálna U-hodnota okien {element["u_value"]:.1f} W/m²K.',
-                    'priority': 'Stredná',
-                    'estimated_savings': '15-20%'
-                })
+        
+        # Hodnotenie obálky - priamy prístup k prvkom podľa názvu
+        by_name = {e.name: e for e in results['envelope_analysis']['details']}
+        
+        wall = by_name.get('Obvodová stena')
+        if wall and wall.u_value > 0.30:
+            recommendations.append({
+                'category': 'Tepelná izolácia',
+                'title': 'Zateplenie obvodových stien',
+                'description': f'Aktuálna U-hodnota {wall.u_value:.2f} W/m²K je vysoká.',
+                'priority': 'Vysoká',
+                'estimated_savings': '25-35%'
+            })
+            
+        windows = by_name.get('Okná')
+        if windows and windows.u_value > 2.0:
+            recommendations.append({
+                'category': 'Výplne otvorov',
+                'title': 'Výmena okien',
+                'description': f'Aktuálna U-hodnota okien {windows.u_value:.1f} W/m²K.',
+                'priority': 'Stredná',
+                'estimated_savings': '15-20%'
+            })
         
         # Hodnotenie systémov
         if self.audit_data['systems']['heating']['efficiency'] < 0.85:
@@ -874,16 +991,20 @@ class EnergyAuditGUI:
                 'priority': 'Stredná',
                 'estimated_savings': '10-15%'
             })
-            
+        
         return recommendations
     
-    def generate_report(self):
+    def generate_report(self, ctx=None):
         """Generovanie reportu"""
-        self.report_text.delete(1.0, tk.END)
-        
+        if ctx is None:
+            ctx = self._build_render_context()
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        building = self.audit_data['building']
-        results = self.results
+        building = ctx['building']
+        results = ctx['results']
+        ec = results['energy_consumption']
+        pe = results['primary_energy']
+        co2 = results['co2_emissions']
+        cls = results['energy_class']
         
         report = f"""
 {'='*80}
@@ -904,16 +1025,16 @@ Energetické hodnotenie budovy {building['name']}
 • Podlahová plocha: {building['floor_area']:.0f} m²
 
 ⚡ ENERGETICKÉ VÝSLEDKY:
-• Energetická trieda: {results['energy_class']['class']}
-• Primárna energia: {results['primary_energy']['specific']:.1f} kWh/m²rok
-• CO2 emisie: {results['co2_emissions']['specific']:.1f} kg CO2/m²rok
-• Celková spotreba: {results['energy_consumption']['total_energy']:.0f} kWh/rok
+• Energetická trieda: {cls['class']}
+• Primárna energia: {pe['specific']:.1f} kWh/m²rok
+• CO2 emisie: {co2['specific']:.1f} kg CO2/m²rok
+• Celková spotreba: {ec['total_energy']:.0f} kWh/rok
 
 🏠 OBÁLKA BUDOVY:
 """
         
-        for detail in results['envelope_analysis']['details']:
-            report += f"• {detail['name']}: {detail['area']:.0f} m², U={detail['u_value']:.2f} W/m²K\n"
+        for row in ctx['env_rows']:
+            report += f"• {row}\n"
         
         # Odporúčania
         recommendations = self.generate_recommendations()
@@ -926,14 +1047,12 @@ Energetické hodnotenie budovy {building['name']}
                 report += f"   Očakávané úspory: {rec['estimated_savings']}\n\n"
         
         report += f"\n📋 CERTIFIKÁCIA:\n"
-        report += f"• Energetická trieda: {results['energy_class']['class']}\n"
-        report += f"• Primárna energia: {results['energy_class']['specific_primary_energy']:.1f} kWh/m²rok\n"
-        report += f"• CO2 emisie: {results['co2_emissions']['specific']:.1f} kg CO2/m²rok\n"
+        report += f"• Energetická trieda: {cls['class']}\n"
+        report += f"• Primárna energia: {cls['specific_primary_energy']:.1f} kWh/m²rok\n"
+        report += f"• CO2 emisie: {co2['specific']:.1f} kg CO2/m²rok\n"
         
-        self.report_text.insert(tk.END, report)
-        
-        # Prepnúť na tab s reportom
-        self.notebook.select(self.report_tab)
+        self.report_text.replace(1.0, tk.END, report)
+        self._last_report_rev = self._audit_rev
     
     def save_project(self):
         """Uloženie projektu"""
@@ -955,13 +1074,12 @@ Energetické hodnotenie budovy {building['name']}
                     'timestamp': datetime.now().isoformat()
                 }
                 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(project_data, f, ensure_ascii=False, indent=2, default=str)
-                
-                messagebox.showinfo("Úspech", f"Projekt uložený: {filename}")
+                self._run_io(_write_bytes, (filename, _json_bytes(project_data)),
+                             lambda: messagebox.showinfo("Úspech", f"Projekt uložený: {filename}"),
+                             "Chyba pri ukladaní")
                 
             except Exception as e:
-                messagebox.showerror("Chyba", f"Chyba pri ukladaní: {e}")
+                self._report_error("Chyba pri ukladaní", e)
     
     def load_project(self):
         """Načítanie projektu"""
@@ -975,20 +1093,26 @@ Energetické hodnotenie budovy {building['name']}
                 with open(filename, 'r', encoding='utf-8') as f:
                     project_data = json.load(f)
                 
-                self.audit_data = project_data.get('audit_data', {})
-                self.results = project_data.get('results', {})
+                self.audit_data = dict(project_data.get('audit_data', _EMPTY))
+                self.results = dict(project_data.get('results', _EMPTY))
+                envelope = self.results.get('envelope_analysis')
+                if envelope:
+                    envelope['details'] = [EnvelopeElement(**d) for d in envelope['details']]
+                if self.results and 'recommendations' not in self.results:
+                    # Staršie projekty nemajú odporúčania uložené vo výsledkoch
+                    self.results['recommendations'] = self._compute_recommendations(self.results)
+                self._audit_rev += 1
                 
                 # Načítanie dát do GUI
                 self.load_data_to_gui()
                 
                 if self.results:
                     self.display_results()
-                    self.generate_report()
                 
                 messagebox.showinfo("Úspech", f"Projekt načítaný: {filename}")
                 
             except Exception as e:
-                messagebox.showerror("Chyba", f"Chyba pri načítaní: {e}")
+                self._report_error("Chyba pri načítaní", e)
     
     def load_data_to_gui(self):
         """Načítanie dát do GUI formulárov"""
@@ -996,7 +1120,7 @@ Energetické hodnotenie budovy {building['name']}
             return
             
         try:
-            building = self.audit_data.get('building', {})
+            building = self.audit_data.get('building', _EMPTY)
             
             # Základné údaje
             self.building_name.delete(0, tk.END)
@@ -1031,6 +1155,7 @@ Energetické hodnotenie budovy {building['name']}
         try:
             building = self.audit_data['building']
             results = self.results
+            now = datetime.now()
             
             certificate_data = {
                 'building_name': building['name'],
@@ -1040,10 +1165,10 @@ Energetické hodnotenie budovy {building['name']}
                 'energy_class': results['energy_class']['class'],
                 'primary_energy': results['primary_energy']['specific'],
                 'co2_emissions': results['co2_emissions']['specific'],
-                'issue_date': datetime.now().strftime('%Y-%m-%d'),
-                'valid_until': (datetime.now().replace(year=datetime.now().year + 10)).strftime('%Y-%m-%d'),
+                'issue_date': now.strftime('%Y-%m-%d'),
+                'valid_until': now.replace(year=now.year + 10).strftime('%Y-%m-%d'),
                 'auditor': 'Ing. Energetický Audítor',
-                'certificate_number': f"EC-{datetime.now().strftime('%Y%m%d%H%M')}"
+                'certificate_number': f"EC-{now.strftime('%Y%m%d%H%M')}"
             }
             
             certificate = {
@@ -1056,23 +1181,25 @@ Energetické hodnotenie budovy {building['name']}
                 }
             }
             
-            filename = f"certifikat_{building['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.json"
+            safe_name = building['name'].translate(_FNAME_TABLE)
+            filename = f"certifikat_{safe_name}_{now.strftime('%Y%m%d')}.json"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'certificate_data': certificate_data,
-                    'certificate': certificate
-                }, f, ensure_ascii=False, indent=2, default=str)
+            payload = {
+                'certificate_data': certificate_data,
+                'certificate': certificate
+            }
             
-            messagebox.showinfo("Úspech", 
-                               f"✅ Energetický certifikát vygenerovaný!\n\n"
-                               f"📁 Súbor: {filename}\n"
-                               f"📋 Číslo: {certificate_data['certificate_number']}\n"
-                               f"🏅 Trieda: {certificate_data['energy_class']}\n"
-                               f"⚡ Primárna energia: {certificate_data['primary_energy']:.1f} kWh/m²rok")
+            self._run_io(_write_bytes, (filename, _json_bytes(payload)),
+                         lambda: messagebox.showinfo("Úspech", 
+                                                     f"✅ Energetický certifikát vygenerovaný!\n\n"
+                                                     f"📁 Súbor: {filename}\n"
+                                                     f"📋 Číslo: {certificate_data['certificate_number']}\n"
+                                                     f"🏅 Trieda: {certificate_data['energy_class']}\n"
+                                                     f"⚡ Primárna energia: {certificate_data['primary_energy']:.1f} kWh/m²rok"),
+                         "Chyba pri generovaní certifikátu")
         
         except Exception as e:
-            messagebox.showerror("Chyba", f"Chyba pri generovaní certifikátu: {e}")
+            self._report_error("Chyba pri generovaní certifikátu", e)
     
     def export_results(self):
         """Export výsledkov"""
@@ -1093,9 +1220,9 @@ Energetické hodnotenie budovy {building['name']}
         if filename:
             try:
                 if filename.endswith('.txt'):
-                    # Export do textového súboru
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(self.results_text.get(1.0, tk.END))
+                    # Export do textového súboru - obsah sa zakóduje naraz
+                    data = self.results_text.get(1.0, tk.END).encode('utf-8')
+                    task, args = _write_bytes, (filename, data)
                 else:
                     # Export do JSON
                     export_data = {
@@ -1105,13 +1232,14 @@ Energetické hodnotenie budovy {building['name']}
                         'export_timestamp': datetime.now().isoformat()
                     }
                     
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+                    task, args = _write_bytes, (filename, _json_bytes(export_data))
                 
-                messagebox.showinfo("Úspech", f"Výsledky exportované: {filename}")
+                self._run_io(task, args,
+                             lambda: messagebox.showinfo("Úspech", f"Výsledky exportované: {filename}"),
+                             "Chyba pri exporte")
                 
             except Exception as e:
-                messagebox.showerror("Chyba", f"Chyba pri exporte: {e}")
+                self._report_error("Chyba pri exporte", e)
 
 def main():
     """Hlavná funkcia"""
@@ -6,50 +6,318 @@ Profesionálny energetický audit s možnosťou zadávania reálnych projektový
 
 import sys
 import os
+import bisect
+import collections
+from types import MappingProxyType
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from datetime import datetime
+from enum import IntEnum
 import json
 from typing import Dict, List, Any, Optional
 
-# Import našich modulov
+import numpy as np
+
+# Numba je voliteľná - bez nej sa numerické jadro vykoná v čistom Pythone
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Náhrada za numba.njit, ktorá funkciu ponechá bez zmeny"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Rýchle JSON enkódery sú voliteľné: orjson, potom ujson, inak štandardný json
 try:
-    from src.energy_calculations import get_energy_calculator
-    from src.thermal_analysis import Construction, MaterialLayer, ConstructionType
-    from src.certificate_generator import get_certificate_generator
-except ImportError as e:
-    print(f"Import warning: {e}")
-    # Fallback - vytvoríme vlastné implementácie
-    def get_energy_calculator():
-        return None
-    def get_certificate_generator():
-        return None
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+def _dump_json(data) -> bytes:
+    """Serializácia reportu do UTF-8 JSON s odsadením"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    if UJSON_AVAILABLE:
+        try:
+            return ujson.dumps(data, indent=2, ensure_ascii=False,
+                               escape_forward_slashes=False).encode('utf-8')
+        except (TypeError, OverflowError):
+            pass  # neserializovateľné hodnoty rieši štandardný json cez default=str
+    return json.dumps(data, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+def _parse_float_or(s: str, default: Optional[float]) -> Optional[float]:
+    """Prevod textu na číslo; prázdny alebo neplatný text vráti predvolenú hodnotu"""
+    s = s.strip()
+    if not s:
+        return default
+    try:
+        return float(s)
+    except ValueError:
+        return default
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Zápis hotového obsahu priamo cez deskriptor súboru (bez textovej vrstvy)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Číselníky pre interaktívny zber údajov
+_BUILDING_TYPES = MappingProxyType({
+    '1': 'Rodinný dom',
+    '2': 'Bytový dom',
+    '3': 'Administratívna budova', 
+    '4': 'Priemyselná budova',
+    '5': 'Škola',
+    '6': 'Nemocnica',
+    '7': 'Hotel',
+    '8': 'Obchodné centrum'
+})
+
+_TYPICAL_WALL_U_VALUES = MappingProxyType({
+    '1': 0.25,  # Kontaktná izolácia
+    '2': 0.30,  # Sendvič
+    '3': 0.22,  # ŽB s izoláciou
+    '4': 0.20   # Drevená
+})
+
+_WINDOW_U_VALUES = MappingProxyType({'1': 5.0, '2': 2.8, '3': 1.1, '4': 0.8})
+
+_HEATING_TYPES = MappingProxyType({
+    '1': {'name': 'Plynový kotol', 'efficiency': 0.90, 'fuel': 'natural_gas'},
+    '2': {'name': 'Elektrické vykurovanie', 'efficiency': 1.0, 'fuel': 'electricity'},
+    '3': {'name': 'Tepelné čerpadlo', 'efficiency': 3.5, 'fuel': 'electricity'}, 
+    '4': {'name': 'Biomasa', 'efficiency': 0.80, 'fuel': 'biomass'},
+    '5': {'name': 'Diaľkové vykurovanie', 'efficiency': 0.95, 'fuel': 'district_heating'}
+})
+
+class VentKind(IntEnum):
+    """Druh vetrania"""
+    NATURAL = 0
+    MECHANICAL = 1
+    RECOVERY = 2
+
+
+_VENT_SYSTEMS = MappingProxyType({
+    '1': {'name': 'Prirodzené', 'kind': VentKind.NATURAL, 'recovery_efficiency': 0.0},
+    '2': {'name': 'Mechanické', 'kind': VentKind.MECHANICAL, 'recovery_efficiency': 0.0},
+    '3': {'name': 'Rekuperácia 70%', 'kind': VentKind.RECOVERY, 'recovery_efficiency': 0.70},
+    '4': {'name': 'Rekuperácia 85%', 'kind': VentKind.RECOVERY, 'recovery_efficiency': 0.85}
+})
+
+_CLIMATE_ZONES = MappingProxyType({
+    '1': {'name': 'Bratislava', 'hdd': 2800, 'avg_temp': 10.5},
+    '2': {'name': 'Západné SK', 'hdd': 3000, 'avg_temp': 9.8},
+    '3': {'name': 'Stredné SK', 'hdd': 3200, 'avg_temp': 8.5},
+    '4': {'name': 'Východné SK', 'hdd': 3100, 'avg_temp': 9.0},
+    '5': {'name': 'Horské oblasti', 'hdd': 3800, 'avg_temp': 6.5}
+})
+
+# Faktory primárnej energie a emisné faktory [kg CO2/kWh]
+_PRIMARY_FACTORS = MappingProxyType({
+    'natural_gas': 1.1,
+    'electricity': 3.0,
+    'biomass': 0.2,
+    'district_heating': 1.3
+})
+
+_EMISSION_FACTORS = MappingProxyType({
+    'natural_gas': 0.202,
+    'electricity': 0.486,
+    'biomass': 0.018,
+    'district_heating': 0.280
+})
+
+# Tabuľka na nahradenie znakov nepovolených v názvoch súborov
+_FILENAME_TABLE = str.maketrans({c: '_' for c in ' /\\:*?"<>|'})
+
+# Oddeľovače sekcií vo výpisoch
+_RULE = "=" * 80
+
+# Šablóna súhrnného reportu (format_map nad slovníkom sekcií výsledkov)
+_SUMMARY_TEMPLATE = (
+    "\n{rule}\n"
+    "📋 SÚHRNNÝ ENERGETICKÝ AUDIT\n"
+    "{rule}\n"
+    "🏢 Budova: {b[name]}\n"
+    "📍 Adresa: {b[address]}\n"
+    "🏗️  Typ: {b[type]}\n"
+    "📐 Podlahová plocha: {b[floor_area]:.0f} m²\n"
+    "📅 Rok výstavby: {b[construction_year]}\n"
+    "\n⚡ ENERGETICKÁ BILANCIA:\n"
+    "├─ Potreba tepla na vykurovanie: {ha[net_heating_need]:.0f} kWh/rok\n"
+    "├─ Spotreba na vykurovanie: {ec[heating_energy]:.0f} kWh/rok\n"
+    "├─ Spotreba na TUV: {ec[dhw_energy]:.0f} kWh/rok\n"
+    "├─ Elektrická energia: {ec[electricity]:.0f} kWh/rok\n"
+    "└─ Celková spotreba: {ec[total_energy]:.0f} kWh/rok\n"
+    "\n🎯 ENERGETICKÉ HODNOTENIE:\n"
+    "├─ Energetická trieda: {cls[class]}\n"
+    "├─ Primárna energia: {pe[specific]:.1f} kWh/m²rok\n"
+    "├─ CO2 emisie: {co2[specific]:.1f} kg CO2/m²rok\n"
+    "└─ Špecifická spotreba: {ec[specific_total]:.1f} kWh/m²rok\n"
+    "\n🏠 OBÁLKA BUDOVY:\n"
+    "{envelope}"
+    "└─ Celkový súčiniteľ prestupu: {env[total_heat_loss_coefficient]:.1f} W/K\n"
+    "\n💡 HLAVNÉ ODPORÚČANIA:\n"
+    "{recommendations}"
+)
+
+# Horné hranice energetických tried [kWh/m²rok] (hranica patrí ešte do triedy)
+_CLASS_THRESHOLDS = (50, 75, 110, 150, 200, 250)
+_CLASSES = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+_CLASS_THRESHOLDS_ARR = np.array(_CLASS_THRESHOLDS, dtype=np.float64)
+_CLASSES_ARR = np.array(_CLASSES)
+
+
+@njit('float64(float64[::1], float64[::1])', cache=True)
+def _env_hloss4(areas, u_values):
+    """Merná tepelná strata prechodom pre typickú obálku so 4 konštrukciami [W/K]"""
+    return areas[0] * u_values[0] + areas[1] * u_values[1] + areas[2] * u_values[2] + areas[3] * u_values[3]
+
+
+@njit(cache=True)
+def _env_hloss(areas, u_values):
+    """Merná tepelná strata prechodom pre ľubovoľný počet konštrukcií [W/K]"""
+    total = 0.0
+    for i in range(areas.shape[0]):
+        total += areas[i] * u_values[i]
+    return total
+
+
+@njit(cache=True)
+def _compute_core(total_heat_loss, volume, hdd, air_change_rate, heating_eff, dhw_eff,
+                  occupants, floor_area, heated_area, pf_heat, pf_dhw, pf_el,
+                  ef_heat, ef_dhw, ef_el, window_area):
+    """Numerické jadro výpočtu energetickej bilancie (len čísla float64)"""
+    # Tepelné straty obálkou a vetraním
+    heating_need = total_heat_loss * hdd * 24 / 1000  # kWh/rok
+    ventilation_loss = volume * air_change_rate * 0.34 * hdd * 24 / 1000
+    total_heating_need = heating_need + ventilation_loss
+    
+    # Solárne a vnútorné zisky
+    solar_gains = window_area * 150  # kWh/rok (zjednodušene)
+    internal_gains = floor_area * 3.5 * 365 / 1000  # kWh/rok
+    net_heating_need = max(0.0, total_heating_need - solar_gains - internal_gains)
+    
+    # Spotreba energie
+    heating_energy = net_heating_need / heating_eff
+    dhw_need = occupants * 25 * 365 / 1000  # kWh/rok (25 l/os/deň)
+    dhw_energy = dhw_need / dhw_eff
+    electricity_need = floor_area * 15  # kWh/m²rok
+    
+    # Primárna energia
+    heating_primary = heating_energy * pf_heat
+    dhw_primary = dhw_energy * pf_dhw
+    electricity_primary = electricity_need * pf_el
+    total_primary = heating_primary + dhw_primary + electricity_primary
+    specific_primary = total_primary / heated_area
+    
+    # CO2 emisie
+    heating_co2 = heating_energy * ef_heat
+    dhw_co2 = dhw_energy * ef_dhw
+    electricity_co2 = electricity_need * ef_el
+    total_co2 = heating_co2 + dhw_co2 + electricity_co2
+    
+    return (heating_need, ventilation_loss, total_heating_need,
+            solar_gains, internal_gains, net_heating_need,
+            heating_energy, dhw_energy, electricity_need,
+            heating_primary, dhw_primary, electricity_primary, total_primary, specific_primary,
+            heating_co2, dhw_co2, electricity_co2, total_co2)
+
 
 class InteractiveEnergyAudit:
     """Interaktívny systém pre energetický audit"""
     
+    __slots__ = ('audit_data', 'results', 'certificate_generator', '_ask', '_now', '_recs_cache')
+    
     def __init__(self):
         self.audit_data = {}
         self.results = {}
-        # Zjednodušené inicializácie
+        self._ask = self._make_reader()
+        # Čas auditu - nastaví sa raz na začiatku behu
+        self._now = None
+        # Odporúčania k aktuálnym výsledkom: (results, odporúčania)
+        self._recs_cache = None
+        # Generátor certifikátov sa načíta až pri generovaní certifikátu
+        self.certificate_generator = None
+        
+    @staticmethod
+    def classify(specific_primary: np.ndarray) -> np.ndarray:
+        """Energetické triedy pre pole merných primárnych energií [kWh/m²rok]"""
+        idx = np.searchsorted(_CLASS_THRESHOLDS_ARR, specific_primary, side='left')
+        return _CLASSES_ARR[idx]
+    
+    def _make_reader(self):
+        """Funkcia na čítanie odpovedí - presmerovaný vstup sa načíta naraz"""
+        if sys.stdin.isatty():
+            return input
+        
+        answers = None
+        
+        def ask(prompt=''):
+            nonlocal answers
+            if answers is None:
+                answers = collections.deque(sys.stdin.read().splitlines())
+            sys.stdout.write(prompt)
+            if not answers:
+                raise EOFError
+            return answers.popleft()
+        
+        return ask
+        
+    def _ask_float(self, prompt: str, default: Optional[float]) -> Optional[float]:
+        """Načítanie desatinného čísla, pri prázdnom alebo neplatnom vstupe predvolená hodnota"""
+        return _parse_float_or(self._ask(prompt), default)
+    
+    def _ask_int(self, prompt: str, default: int) -> int:
+        """Načítanie celého čísla, pri prázdnom alebo neplatnom vstupe predvolená hodnota"""
+        answer = self._ask(prompt).strip()
+        if not answer:
+            return default
         try:
-            self.certificate_generator = get_certificate_generator()
-        except:
-            self.certificate_generator = None
+            return int(answer)
+        except ValueError:
+            return default
+    
+    def _ask_choice(self, prompt: str, mapping, default_key: str):
+        """Výber položky z číselníka, pri neznámej voľbe predvolená položka"""
+        return mapping.get(self._ask(prompt).strip(), mapping[default_key])
         
     def welcome_screen(self):
         """Uvítacia obrazovka"""
-        print("="*80)
-        print("🏢 PROFESIONÁLNY ENERGETICKÝ AUDIT SYSTÉM")
-        print("📋 Podľa STN EN 16247 a slovenských noriem")
-        print("="*80)
-        print()
-        print("Tento systém vám umožní:")
-        print("✅ Zadať reálne projektové dáta")
-        print("✅ Vypočítať energetické vlastnosti podľa noriem") 
-        print("✅ Vytvoriť profesionálny audit report")
-        print("✅ Vygenerovať energetický certifikát")
-        print()
+        lines = [
+            _RULE,
+            "🏢 PROFESIONÁLNY ENERGETICKÝ AUDIT SYSTÉM",
+            "📋 Podľa STN EN 16247 a slovenských noriem",
+            _RULE,
+            "",
+            "Tento systém vám umožní:",
+            "✅ Zadať reálne projektové dáta",
+            "✅ Vypočítať energetické vlastnosti podľa noriem",
+            "✅ Vytvoriť profesionálny audit report",
+            "✅ Vygenerovať energetický certifikát",
+            "",
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
         
     def collect_basic_building_data(self) -> Dict[str, Any]:
         """Zber základných údajov o budove"""
@@ -59,8 +327,8 @@ class InteractiveEnergyAudit:
         building_data = {}
         
         # Základné informácie
-        building_data['name'] = input("Názov budovy: ").strip()
-        building_data['address'] = input("Adresa: ").strip()
+        building_data['name'] = self._ask("Názov budovy: ").strip()
+        building_data['address'] = self._ask("Adresa: ").strip()
         
         # Typ budovy
         print("\nTypy budov:")
@@ -73,27 +341,16 @@ class InteractiveEnergyAudit:
         print("7. Hotel")
         print("8. Obchodné centrum")
         
-        building_type_choice = input("Vyberte typ budovy (1-8): ").strip()
-        building_types = {
-            '1': 'Rodinný dom',
-            '2': 'Bytový dom',
-            '3': 'Administratívna budova', 
-            '4': 'Priemyselná budova',
-            '5': 'Škola',
-            '6': 'Nemocnica',
-            '7': 'Hotel',
-            '8': 'Obchodné centrum'
-        }
-        building_data['type'] = building_types.get(building_type_choice, 'Rodinný dom')
+        building_data['type'] = self._ask_choice("Vyberte typ budovy (1-8): ", _BUILDING_TYPES, '1')
         
         # Geometrické parametre
         print("\n📐 GEOMETRICKÉ PARAMETRE:")
         try:
-            building_data['floor_area'] = float(input("Podlahová plocha [m²]: ").strip())
-            building_data['heated_area'] = float(input("Vykurovaná plocha [m²]: ").strip())
-            building_data['volume'] = float(input("Objem budovy [m³]: ").strip())
-            building_data['height'] = float(input("Výška budovy [m]: ").strip())
-            building_data['floors'] = int(input("Počet podlaží: ").strip())
+            building_data['floor_area'] = float(self._ask("Podlahová plocha [m²]: ").strip())
+            building_data['heated_area'] = float(self._ask("Vykurovaná plocha [m²]: ").strip())
+            building_data['volume'] = float(self._ask("Objem budovy [m³]: ").strip())
+            building_data['height'] = float(self._ask("Výška budovy [m]: ").strip())
+            building_data['floors'] = int(self._ask("Počet podlaží: ").strip())
         except ValueError:
             print("❌ Neplatné číslo, používam predvolené hodnoty")
             building_data['floor_area'] = 120.0
@@ -103,11 +360,8 @@ class InteractiveEnergyAudit:
             building_data['floors'] = 2
         
         # Rok výstavby
-        try:
-            building_data['construction_year'] = int(input("Rok výstavby: ").strip())
-        except ValueError:
-            building_data['construction_year'] = 2000
-            
+        building_data['construction_year'] = self._ask_int("Rok výstavby: ", 2000)
+        
         return building_data
     
     def collect_envelope_data(self) -> Dict[str, Any]:
@@ -119,7 +373,7 @@ class InteractiveEnergyAudit:
         
         # Steny
         print("\n🧱 OBVODOVÉ STENY:")
-        wall_area = float(input("Celková plocha obvodových stien [m²]: ").strip() or "150")
+        wall_area = self._ask_float("Celková plocha obvodových stien [m²]: ", 150.0)
         
         print("Vyberte typ obvodovej steny:")
         print("1. Muriva s kontaktnou izoláciou")
@@ -128,20 +382,22 @@ class InteractiveEnergyAudit:
         print("4. Drevená konštrukcia")
         print("5. Vlastná konštrukcia")
         
-        wall_choice = input("Výber (1-5): ").strip()
+        wall_choice = self._ask("Výber (1-5): ").strip()
         
         if wall_choice == "5":
+            from src.thermal_analysis import Construction, MaterialLayer, ConstructionType
+            
             print("Zadajte vrstvy konštrukcie (zvnútra smerom von):")
             layers = []
-            layer_count = int(input("Počet vrstiev: ").strip() or "4")
+            layer_count = self._ask_int("Počet vrstiev: ", 4)
             
             for i in range(layer_count):
                 print(f"\nVrstva {i+1}:")
-                material = input("  Materiál: ").strip()
-                thickness = float(input("  Hrúbka [m]: ").strip())
-                lambda_val = float(input("  Lambda [W/mK]: ").strip())
-                density = float(input("  Hustota [kg/m³]: ").strip() or "1800")
-                heat_capacity = float(input("  Merná tepelná kapacita [J/kgK]: ").strip() or "1000")
+                material = self._ask("  Materiál: ").strip()
+                thickness = float(self._ask("  Hrúbka [m]: ").strip())
+                lambda_val = float(self._ask("  Lambda [W/mK]: ").strip())
+                density = self._ask_float("  Hustota [kg/m³]: ", 1800.0)
+                heat_capacity = self._ask_float("  Merná tepelná kapacita [J/kgK]: ", 1000.0)
                 
                 layers.append(MaterialLayer(material, thickness, lambda_val, density, heat_capacity))
             
@@ -150,13 +406,7 @@ class InteractiveEnergyAudit:
             
         else:
             # Predvolené konštrukcie
-            typical_u_values = {
-                '1': 0.25,  # Kontaktná izolácia
-                '2': 0.30,  # Sendvič
-                '3': 0.22,  # ŽB s izoláciou
-                '4': 0.20   # Drevená
-            }
-            u_value = typical_u_values.get(wall_choice, 0.25)
+            u_value = _TYPICAL_WALL_U_VALUES.get(wall_choice, 0.25)
             print(f"Použitá U-hodnota: {u_value} W/m²K")
         
         envelope_data['constructions'].append({
@@ -168,8 +418,8 @@ class InteractiveEnergyAudit:
         
         # Strecha
         print("\n🏠 STRECHA:")
-        roof_area = float(input("Plocha strechy [m²]: ").strip() or "80")
-        roof_u = float(input("U-hodnota strechy [W/m²K] (Enter=0.20): ").strip() or "0.20")
+        roof_area = self._ask_float("Plocha strechy [m²]: ", 80.0)
+        roof_u = self._ask_float("U-hodnota strechy [W/m²K] (Enter=0.20): ", 0.20)
         
         envelope_data['constructions'].append({
             'name': 'Strecha',
@@ -180,8 +430,8 @@ class InteractiveEnergyAudit:
         
         # Podlaha
         print("\n🔲 PODLAHA:")
-        floor_area = float(input("Plocha podlahy [m²]: ").strip() or "80")
-        floor_u = float(input("U-hodnota podlahy [W/m²K] (Enter=0.30): ").strip() or "0.30")
+        floor_area = self._ask_float("Plocha podlahy [m²]: ", 80.0)
+        floor_u = self._ask_float("U-hodnota podlahy [W/m²K] (Enter=0.30): ", 0.30)
         
         envelope_data['constructions'].append({
             'name': 'Podlaha',
@@ -192,7 +442,7 @@ class InteractiveEnergyAudit:
         
         # Okná
         print("\n🪟 OKNÁ:")
-        window_area = float(input("Celková plocha okien [m²]: ").strip() or "25")
+        window_area = self._ask_float("Celková plocha okien [m²]: ", 25.0)
         
         print("Typ okien:")
         print("1. Jednosklo (U=5.0)")
@@ -201,13 +451,12 @@ class InteractiveEnergyAudit:
         print("4. Pasívne okná (U=0.8)")
         print("5. Vlastná hodnota")
         
-        window_choice = input("Výber (1-5): ").strip()
-        window_u_values = {'1': 5.0, '2': 2.8, '3': 1.1, '4': 0.8}
+        window_choice = self._ask("Výber (1-5): ").strip()
         
         if window_choice == '5':
-            window_u = float(input("U-hodnota okien [W/m²K]: ").strip())
+            window_u = float(self._ask("U-hodnota okien [W/m²K]: ").strip())
         else:
-            window_u = window_u_values.get(window_choice, 2.8)
+            window_u = _WINDOW_U_VALUES.get(window_choice, 2.8)
             
         print(f"Použitá U-hodnota okien: {window_u} W/m²K")
         
@@ -218,6 +467,12 @@ class InteractiveEnergyAudit:
             'u_value': window_u
         })
         
+        # Paralelné polia plôch a U-hodnôt pre výpočet strát (zoznam slúži na výstup)
+        constructions = envelope_data['constructions']
+        envelope_data['areas'] = np.asarray([c['area'] for c in constructions], dtype=np.float64)
+        envelope_data['u_values'] = np.asarray([c['u_value'] for c in constructions], dtype=np.float64)
+        envelope_data['by_type'] = {c['type']: i for i, c in enumerate(constructions)}
+        
         return envelope_data
     
     def collect_systems_data(self) -> Dict[str, Any]:
@@ -235,39 +490,30 @@ class InteractiveEnergyAudit:
         print("4. Biomasa")
         print("5. Diaľkové vykurovanie")
         
-        heating_choice = input("Typ vykurovania (1-5): ").strip()
-        heating_types = {
-            '1': {'name': 'Plynový kotol', 'efficiency': 0.90, 'fuel': 'natural_gas'},
-            '2': {'name': 'Elektrické vykurovanie', 'efficiency': 1.0, 'fuel': 'electricity'},
-            '3': {'name': 'Tepelné čerpadlo', 'efficiency': 3.5, 'fuel': 'electricity'}, 
-            '4': {'name': 'Biomasa', 'efficiency': 0.80, 'fuel': 'biomass'},
-            '5': {'name': 'Diaľkové vykurovanie', 'efficiency': 0.95, 'fuel': 'district_heating'}
-        }
-        
-        heating_system = heating_types.get(heating_choice, heating_types['1'])
+        # Kópia, pretože účinnosť sa môže upraviť nižšie
+        heating_system = dict(self._ask_choice("Typ vykurovania (1-5): ", _HEATING_TYPES, '1'))
         
         # Možnosť zadania vlastnej účinnosti
-        custom_efficiency = input(f"Účinnosť systému [%] (Enter={heating_system['efficiency']*100:.1f}%): ").strip()
-        if custom_efficiency:
-            try:
-                heating_system['efficiency'] = float(custom_efficiency) / 100
-            except ValueError:
-                pass
+        custom_efficiency = self._ask_float(f"Účinnosť systému [%] (Enter={heating_system['efficiency']*100:.1f}%): ", None)
+        if custom_efficiency is not None:
+            heating_system['efficiency'] = custom_efficiency / 100
                 
         systems_data['heating'] = heating_system
         
         # Teplá voda
         print("\n🚿 PRÍPRAVA TEPLEJ VODY:")
-        dhw_same = input("Rovnaký systém ako vykurovanie? (a/n): ").strip().lower()
+        dhw_same = self._ask("Rovnaký systém ako vykurovanie? (a/n): ").strip().lower()
         
         if dhw_same == 'n':
-            dhw_choice = input("Typ ohrevu TUV (1-5): ").strip()
-            dhw_system = heating_types.get(dhw_choice, heating_types['2'])
+            dhw_system = dict(self._ask_choice("Typ ohrevu TUV (1-5): ", _HEATING_TYPES, '2'))
         else:
             dhw_system = heating_system.copy()
             
         systems_data['dhw'] = dhw_system
         
+        # Palivá pochádzajú z uzavretého číselníka, výpočet ich indexuje priamo
+        assert heating_system['fuel'] in _PRIMARY_FACTORS and dhw_system['fuel'] in _PRIMARY_FACTORS
+        
         # Vetranie
         print("\n🌬️ VETRANIE:")
         print("1. Prirodzené vetranie")
@@ -275,15 +521,7 @@ class InteractiveEnergyAudit:
         print("3. Rekuperácia (účinnosť 70%)")
         print("4. Rekuperácia (účinnosť 85%)")
         
-        vent_choice = input("Typ vetrania (1-4): ").strip()
-        vent_systems = {
-            '1': {'name': 'Prirodzené', 'recovery_efficiency': 0.0},
-            '2': {'name': 'Mechanické', 'recovery_efficiency': 0.0},
-            '3': {'name': 'Rekuperácia 70%', 'recovery_efficiency': 0.70},
-            '4': {'name': 'Rekuperácia 85%', 'recovery_efficiency': 0.85}
-        }
-        
-        systems_data['ventilation'] = vent_systems.get(vent_choice, vent_systems['1'])
+        systems_data['ventilation'] = self._ask_choice("Typ vetrania (1-4): ", _VENT_SYSTEMS, '1')
         
         return systems_data
     
@@ -295,23 +533,14 @@ class InteractiveEnergyAudit:
         usage_data = {}
         
         # Počet obyvateľov/užívateľov
-        try:
-            usage_data['occupants'] = int(input("Počet stálych obyvateľov/užívateľov: ").strip())
-        except ValueError:
-            usage_data['occupants'] = 4
-            
+        usage_data['occupants'] = self._ask_int("Počet stálych obyvateľov/užívateľov: ", 4)
+        
         # Teplota vykurovania
-        try:
-            usage_data['heating_temp'] = float(input("Požadovaná teplota vykurovania [°C] (Enter=20): ").strip() or "20")
-        except ValueError:
-            usage_data['heating_temp'] = 20.0
-            
+        usage_data['heating_temp'] = self._ask_float("Požadovaná teplota vykurovania [°C] (Enter=20): ", 20.0)
+        
         # Teplota TUV
-        try:
-            usage_data['dhw_temp'] = float(input("Teplota teplej vody [°C] (Enter=55): ").strip() or "55")
-        except ValueError:
-            usage_data['dhw_temp'] = 55.0
-            
+        usage_data['dhw_temp'] = self._ask_float("Teplota teplej vody [°C] (Enter=55): ", 55.0)
+        
         # Klimatická lokalita
         print("\nKlimatická lokalita:")
         print("1. Bratislava a okolie")
@@ -320,16 +549,7 @@ class InteractiveEnergyAudit:
         print("4. Východné Slovensko")
         print("5. Horské oblasti")
         
-        climate_choice = input("Klimatická lokalita (1-5): ").strip()
-        climate_zones = {
-            '1': {'name': 'Bratislava', 'hdd': 2800, 'avg_temp': 10.5},
-            '2': {'name': 'Západné SK', 'hdd': 3000, 'avg_temp': 9.8},
-            '3': {'name': 'Stredné SK', 'hdd': 3200, 'avg_temp': 8.5},
-            '4': {'name': 'Východné SK', 'hdd': 3100, 'avg_temp': 9.0},
-            '5': {'name': 'Horské oblasti', 'hdd': 3800, 'avg_temp': 6.5}
-        }
-        
-        usage_data['climate'] = climate_zones.get(climate_choice, climate_zones['1'])
+        usage_data['climate'] = self._ask_choice("Klimatická lokalita (1-5): ", _CLIMATE_ZONES, '1')
         
         return usage_data
         
@@ -348,47 +568,54 @@ class InteractiveEnergyAudit:
         results = {}
         
         # Výpočet tepelných strát obálkou
-        total_heat_loss = 0
-        envelope_details = []
+        areas = envelope_data['areas']
+        u_values = envelope_data['u_values']
         
-        for construction in envelope_data['constructions']:
-            heat_loss = construction['area'] * construction['u_value']
-            total_heat_loss += heat_loss
-            
-            envelope_details.append({
+        # Korekcia na vetranie - intenzita výmeny vzduchu [h-1] podľa druhu vetrania
+        ventilation = systems_data['ventilation']
+        air_change_rate = (0.5, 0.8, 0.8 * (1 - ventilation['recovery_efficiency']))[ventilation['kind']]
+        
+        window_idx = envelope_data['by_type'].get('window')
+        window_area = areas[window_idx] if window_idx is not None else 20
+        
+        heating_fuel = systems_data['heating']['fuel']
+        dhw_fuel = systems_data['dhw']['fuel']
+        
+        # Typická obálka (stena, strecha, podlaha, okná) má špecializované jadro
+        if areas.shape[0] == 4:
+            total_heat_loss = float(_env_hloss4(areas, u_values))
+        else:
+            total_heat_loss = float(_env_hloss(areas, u_values))
+        
+        (heating_need, ventilation_loss, total_heating_need,
+         solar_gains, internal_gains, net_heating_need,
+         heating_energy, dhw_energy, electricity_need,
+         heating_primary, dhw_primary, electricity_primary, total_primary, specific_primary,
+         heating_co2, dhw_co2, electricity_co2, total_co2) = _compute_core(
+            total_heat_loss,
+            float(building_data['volume']), float(usage_data['climate']['hdd']), air_change_rate,
+            float(systems_data['heating']['efficiency']), float(systems_data['dhw']['efficiency']),
+            float(usage_data['occupants']), float(building_data['floor_area']), float(building_data['heated_area']),
+            _PRIMARY_FACTORS[heating_fuel], _PRIMARY_FACTORS[dhw_fuel], _PRIMARY_FACTORS['electricity'],
+            _EMISSION_FACTORS[heating_fuel], _EMISSION_FACTORS[dhw_fuel], _EMISSION_FACTORS['electricity'],
+            float(window_area)
+        )
+        
+        envelope_details = [
+            {
                 'name': construction['name'],
                 'area': construction['area'],
                 'u_value': construction['u_value'],
                 'heat_loss': heat_loss
-            })
+            }
+            for construction, heat_loss in zip(envelope_data['constructions'], (areas * u_values).tolist())
+        ]
         
         results['envelope_analysis'] = {
             'total_heat_loss_coefficient': total_heat_loss,
             'details': envelope_details
         }
         
-        # Výpočet potreby tepla na vykurovanie
-        hdd = usage_data['climate']['hdd']
-        heating_need = total_heat_loss * hdd * 24 / 1000  # kWh/rok
-        
-        # Korekcia na vetranie
-        air_change_rate = 0.5  # h-1 (prirodzené)
-        if systems_data['ventilation']['name'] == 'Mechanické':
-            air_change_rate = 0.8
-        elif 'Rekuperácia' in systems_data['ventilation']['name']:
-            air_change_rate = 0.8 * (1 - systems_data['ventilation']['recovery_efficiency'])
-        
-        ventilation_loss = building_data['volume'] * air_change_rate * 0.34 * hdd * 24 / 1000
-        
-        total_heating_need = heating_need + ventilation_loss
-        
-        # Solárne a vnútorné zisky
-        window_area = next((c['area'] for c in envelope_data['constructions'] if c['type'] == 'window'), 20)
-        solar_gains = window_area * 150  # kWh/rok (zjednodušene)
-        internal_gains = building_data['floor_area'] * 3.5 * 365 / 1000  # kWh/rok
-        
-        net_heating_need = max(0, total_heating_need - solar_gains - internal_gains)
-        
         results['heating_analysis'] = {
             'transmission_losses': heating_need,
             'ventilation_losses': ventilation_loss, 
@@ -399,16 +626,6 @@ class InteractiveEnergyAudit:
             'specific_heating_need': net_heating_need / building_data['heated_area']
         }
         
-        # Výpočet spotreby energie na vykurovanie
-        heating_energy = net_heating_need / systems_data['heating']['efficiency']
-        
-        # Výpočet potreby tepla na TUV  
-        dhw_need = usage_data['occupants'] * 25 * 365 / 1000  # kWh/rok (25 l/os/deň)
-        dhw_energy = dhw_need / systems_data['dhw']['efficiency']
-        
-        # Elektrická energia (osvetlenie, spotrebiče)
-        electricity_need = building_data['floor_area'] * 15  # kWh/m²rok
-        
         results['energy_consumption'] = {
             'heating_energy': heating_energy,
             'dhw_energy': dhw_energy,
@@ -417,21 +634,6 @@ class InteractiveEnergyAudit:
             'specific_total': (heating_energy + dhw_energy + electricity_need) / building_data['heated_area']
         }
         
-        # Primárna energia
-        primary_factors = {
-            'natural_gas': 1.1,
-            'electricity': 3.0,
-            'biomass': 0.2,
-            'district_heating': 1.3
-        }
-        
-        heating_primary = heating_energy * primary_factors.get(systems_data['heating']['fuel'], 1.1)
-        dhw_primary = dhw_energy * primary_factors.get(systems_data['dhw']['fuel'], 1.1)
-        electricity_primary = electricity_need * primary_factors['electricity']
-        
-        total_primary = heating_primary + dhw_primary + electricity_primary
-        specific_primary = total_primary / building_data['heated_area']
-        
         results['primary_energy'] = {
             'heating': heating_primary,
             'dhw': dhw_primary, 
@@ -441,40 +643,13 @@ class InteractiveEnergyAudit:
         }
         
         # Energetická trieda
-        if specific_primary <= 50:
-            energy_class = 'A'
-        elif specific_primary <= 75:
-            energy_class = 'B'
-        elif specific_primary <= 110:
-            energy_class = 'C'
-        elif specific_primary <= 150:
-            energy_class = 'D'
-        elif specific_primary <= 200:
-            energy_class = 'E'
-        elif specific_primary <= 250:
-            energy_class = 'F'
-        else:
-            energy_class = 'G'
-            
+        energy_class = _CLASSES[bisect.bisect_left(_CLASS_THRESHOLDS, specific_primary)]
+        
         results['energy_class'] = {
             'class': energy_class,
             'specific_primary_energy': specific_primary
         }
         
-        # CO2 emisie
-        emission_factors = {
-            'natural_gas': 0.202,  # kg CO2/kWh
-            'electricity': 0.486,
-            'biomass': 0.018,
-            'district_heating': 0.280
-        }
-        
-        heating_co2 = heating_energy * emission_factors.get(systems_data['heating']['fuel'], 0.202)
-        dhw_co2 = dhw_energy * emission_factors.get(systems_data['dhw']['fuel'], 0.202)
-        electricity_co2 = electricity_need * emission_factors['electricity']
-        
-        total_co2 = heating_co2 + dhw_co2 + electricity_co2
-        
         results['co2_emissions'] = {
             'heating': heating_co2,
             'dhw': dhw_co2,
@@ -495,7 +670,8 @@ class InteractiveEnergyAudit:
         building = self.audit_data['building']
         results = self.results
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        now = self._now or datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M")
         
         report = {
             'audit_info': {
@@ -516,18 +692,20 @@ class InteractiveEnergyAudit:
         }
         
         # Uloženie reportu
-        report_filename = f"energeticky_audit_{building['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
+        report_filename = f"energeticky_audit_{building['name'].translate(_FILENAME_TABLE)}_{now.strftime('%Y%m%d_%H%M')}.json"
         
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        _write_bytes(report_filename, _dump_json(report))
             
         print(f"✅ Report uložený: {report_filename}")
         return report, report_filename
         
     def _generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generovanie odporúčaní na základe výpočtov"""
-        recommendations = []
         results = self.results
+        if self._recs_cache is not None and self._recs_cache[0] is results:
+            return self._recs_cache[1]
+        
+        recommendations = []
         
         # Hodnotenie obálky
         envelope = results['envelope_analysis']['details']
@@ -561,7 +739,7 @@ class InteractiveEnergyAudit:
                 'estimated_savings': '20-30%'
             })
             
-        if 'Rekuperácia' not in self.audit_data['systems']['ventilation']['name']:
+        if self.audit_data['systems']['ventilation']['kind'] != VentKind.RECOVERY:
             recommendations.append({
                 'category': 'Vetranie',
                 'title': 'Inštalácia rekuperačnej jednotky',
@@ -569,49 +747,40 @@ class InteractiveEnergyAudit:
                 'priority': 'Stredná',
                 'estimated_savings': '10-15%'
             })
-            
+        
+        self._recs_cache = (results, recommendations)
         return recommendations
         
     def print_summary_report(self):
         """Výpis súhrnného reportu na obrazovku"""
-        print("\n" + "="*80)
-        print("📋 SÚHRNNÝ ENERGETICKÝ AUDIT")
-        print("="*80)
-        
         building = self.audit_data['building']
         results = self.results
         
-        print(f"🏢 Budova: {building['name']}")
-        print(f"📍 Adresa: {building['address']}")
-        print(f"🏗️  Typ: {building['type']}")
-        print(f"📐 Podlahová plocha: {building['floor_area']:.0f} m²")
-        print(f"📅 Rok výstavby: {building['construction_year']}")
-        
-        print(f"\n⚡ ENERGETICKÁ BILANCIA:")
-        print(f"├─ Potreba tepla na vykurovanie: {results['heating_analysis']['net_heating_need']:.0f} kWh/rok")
-        print(f"├─ Spotreba na vykurovanie: {results['energy_consumption']['heating_energy']:.0f} kWh/rok")
-        print(f"├─ Spotreba na TUV: {results['energy_consumption']['dhw_energy']:.0f} kWh/rok")
-        print(f"├─ Elektrická energia: {results['energy_consumption']['electricity']:.0f} kWh/rok")
-        print(f"└─ Celková spotreba: {results['energy_consumption']['total_energy']:.0f} kWh/rok")
-        
-        print(f"\n🎯 ENERGETICKÉ HODNOTENIE:")
-        print(f"├─ Energetická trieda: {results['energy_class']['class']}")
-        print(f"├─ Primárna energia: {results['primary_energy']['specific']:.1f} kWh/m²rok") 
-        print(f"├─ CO2 emisie: {results['co2_emissions']['specific']:.1f} kg CO2/m²rok")
-        print(f"└─ Špecifická spotreba: {results['energy_consumption']['specific_total']:.1f} kWh/m²rok")
-        
-        print(f"\n🏠 OBÁLKA BUDOVY:")
-        for detail in results['envelope_analysis']['details']:
-            print(f"├─ {detail['name']}: {detail['area']:.0f} m², U={detail['u_value']:.2f} W/m²K")
-        print(f"└─ Celkový súčiniteľ prestupu: {results['envelope_analysis']['total_heat_loss_coefficient']:.1f} W/K")
-        
-        print(f"\n💡 HLAVNÉ ODPORÚČANIA:")
+        env = results['envelope_analysis']
         recommendations = self._generate_recommendations()
-        for i, rec in enumerate(recommendations[:3], 1):
-            print(f"{i}. {rec['title']} - {rec['estimated_savings']} úspory")
-            
+        ctx = {
+            'rule': _RULE,
+            'b': building,
+            'ha': results['heating_analysis'],
+            'ec': results['energy_consumption'],
+            'pe': results['primary_energy'],
+            'co2': results['co2_emissions'],
+            'cls': results['energy_class'],
+            'env': env,
+            'envelope': ''.join(
+                f"├─ {d['name']}: {d['area']:.0f} m², U={d['u_value']:.2f} W/m²K\n"
+                for d in env['details']
+            ),
+            'recommendations': ''.join(
+                f"{i}. {rec['title']} - {rec['estimated_savings']} úspory\n"
+                for i, rec in enumerate(recommendations[:3], 1)
+            ),
+        }
+        sys.stdout.write(_SUMMARY_TEMPLATE.format_map(ctx))
+        
     def run_interactive_audit(self):
         """Hlavný proces interaktívneho auditu"""
+        self._now = datetime.now()
         self.welcome_screen()
         
         try:
@@ -623,6 +792,7 @@ class InteractiveEnergyAudit:
             
             # Výpočty
             self.results = self.calculate_energy_performance()
+            self._recs_cache = None
             
             # Zobrazenie výsledkov
             self.print_summary_report()
@@ -631,7 +801,7 @@ class InteractiveEnergyAudit:
             report, filename = self.generate_professional_report()
             
             # Možnosť generovania certifikátu
-            generate_cert = input("\n🏅 Chcete vygenerovať energetický certifikát? (a/n): ").strip().lower()
+            generate_cert = self._ask("\n🏅 Chcete vygenerovať energetický certifikát? (a/n): ").strip().lower()
             if generate_cert == 'a':
                 self.generate_energy_certificate()
                 
@@ -654,6 +824,14 @@ class InteractiveEnergyAudit:
         
         building = self.audit_data['building']
         results = self.results
+        now = self._now or datetime.now()
+        
+        if self.certificate_generator is None:
+            try:
+                from src.certificate_generator import get_certificate_generator
+                self.certificate_generator = get_certificate_generator()
+            except Exception as e:
+                print(f"Import warning: {e}")
         
         certificate_data = {
             'building_name': building['name'],
@@ -663,10 +841,10 @@ class InteractiveEnergyAudit:
             'energy_class': results['energy_class']['class'],
             'primary_energy': results['primary_energy']['specific'],
             'co2_emissions': results['co2_emissions']['specific'],
-            'issue_date': datetime.now().strftime('%Y-%m-%d'),
-            'valid_until': (datetime.now().replace(year=datetime.now().year + 10)).strftime('%Y-%m-%d'),
+            'issue_date': now.strftime('%Y-%m-%d'),
+            'valid_until': now.replace(year=now.year + 10).strftime('%Y-%m-%d'),
             'auditor': 'Ing. Energetický Audítor',
-            'certificate_number': f"EC-{datetime.now().strftime('%Y%m%d%H%M')}"
+            'certificate_number': f"EC-{now.strftime('%Y%m%d%H%M')}"
         }
         
         try:
@@ -681,13 +859,12 @@ class InteractiveEnergyAudit:
                 }
             }
             
-            cert_filename = f"certifikat_{building['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.json"
+            cert_filename = f"certifikat_{building['name'].translate(_FILENAME_TABLE)}_{now.strftime('%Y%m%d')}.json"
             
-            with open(cert_filename, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'certificate_data': certificate_data,
-                    'certificate': certificate
-                }, f, ensure_ascii=False, indent=2, default=str)
+            _write_bytes(cert_filename, _dump_json({
+                'certificate_data': certificate_data,
+                'certificate': certificate
+            }))
                 
             print(f"✅ Energetický certifikát vygenerovaný: {cert_filename}")
             print(f"📋 Číslo certifikátu: {certificate_data['certificate_number']}")
@@ -697,8 +874,19 @@ class InteractiveEnergyAudit:
         except Exception as e:
             print(f"❌ Chyba pri generovaní certifikátu: {e}")
 
+def _warmup_kernels():
+    """Predkompiluje Numba jadrá s fiktívnymi vstupmi (naplní diskovú cache)"""
+    dummy = np.ones(4)
+    _env_hloss4(dummy, dummy)
+    _env_hloss(dummy, dummy)
+    _compute_core(1.0, 1.0, 1.0, 0.5, 0.9, 0.9, 1.0, 1.0, 1.0,
+                  1.0, 1.0, 1.0, 0.2, 0.2, 0.2, 1.0)
+
+
 def main():
     """Hlavná funkcia"""
+    if NUMBA_AVAILABLE and os.environ.get('ENERGYAUDIT_NUMBA_WARMUP'):
+        _warmup_kernels()
     audit_system = InteractiveEnergyAudit()
     audit_system.run_interactive_audit()
 
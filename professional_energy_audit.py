@@ -5,13 +5,130 @@ User-friendly s pokročilými funkciami a profesionálnymi výstupmi
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from datetime import datetime
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
-import math
+
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+# Auto-save: interval a cieľový súbor
+AUTOSAVE_INTERVAL_MS = 300000
+AUTOSAVE_FILE = "autosave_professional_audit.json"
+
+# Navigácia: (ikona, popis, kľúč sekcie)
+_NAV_ITEMS = (
+    ("🏠", "Úvod", "welcome"),
+    ("🏢", "Základné údaje", "basic_info"),
+    ("🧱", "Obálka budovy", "envelope"),
+    ("🔥", "Vykurovanie", "heating"),
+    ("❄️", "Chladenie/Vetranie", "cooling"),
+    ("💡", "Osvetlenie", "lighting"),
+    ("🚿", "Teplá voda", "dhw"),
+    ("👥", "Užívanie", "usage"),
+    ("🔍", "Validácia", "validation"),
+    ("📊", "Výsledky", "results"),
+    ("🏅", "Certifikát", "certificate"),
+)
+
+# Akčné tlačidlá: (text, názov metódy, farba)
+_ACTION_BUTTONS = (
+    ("💾 Uložiť", "save_project", '#3498db'),
+    ("📂 Načítať", "load_project", '#9b59b6'),
+    ("📄 Export PDF", "export_pdf", '#e67e22'),
+)
+
+_QUICK_ACTIONS = (
+    ("🆕 Nový projekt", "new_project", '#27ae60'),
+    ("📂 Otvoriť existujúci", "load_project", '#3498db'),
+    ("📚 Príručka", "show_help", '#9b59b6'),
+    ("🧮 Kalkulačky", "u_value_calculator", '#f39c12'),
+)
+
+# Oneskorenie validácie po poslednom stlačení klávesu
+VALIDATE_DELAY_MS = 150
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_and_check(field_name, value, required=False):
+    """Kontrola hodnoty poľa podľa typu a rozsahu (bez vedľajších účinkov)"""
+    # Prázdne pole je chybou len vtedy, keď je povinné
+    if not value:
+        return not required
+    
+    if field_name in ('construction_year', 'floors_count'):
+        try:
+            int_val = int(value)
+        except ValueError:
+            return False
+        if field_name == 'construction_year':
+            return 1800 <= int_val <= 2030
+        return 1 <= int_val <= 100
+        
+    if field_name in ('floor_area', 'volume', 'building_height'):
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+        
+    return True
+
+
+def _write_json(filename, payload):
+    """Serializácia a zápis JSON súboru (beží vo vlákne na pozadí)"""
+    data = json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def _read_json(filename):
+    """Načítanie JSON súboru (beží vo vlákne na pozadí)"""
+    with open(filename, 'rb') as f:
+        data = json.loads(f.read())
+    # Projekt je slovník hodnôt polí formulára
+    if not isinstance(data, dict):
+        raise ValueError("súbor neobsahuje projekt (očakáva sa JSON objekt)")
+    return data
+
+
+def _write_pdf(filename, payload):
+    """Jednoduchý PDF výpis údajov projektu (beží vo vlákne na pozadí)"""
+    pdf = canvas.Canvas(filename, pagesize=A4)
+    width, height = A4
+    y = height - 60
+    pdf.setFont('Helvetica-Bold', 16)
+    pdf.drawString(50, y, "Energeticky audit - STN EN 16247-1")
+    pdf.setFont('Helvetica', 10)
+    y -= 20
+    pdf.drawString(50, y, datetime.now().strftime('%d.%m.%Y %H:%M'))
+    y -= 30
+    for key, value in payload.items():
+        if y < 50:
+            pdf.showPage()
+            pdf.setFont('Helvetica', 10)
+            y = height - 60
+        pdf.drawString(50, y, f"{key}: {value}")
+        y -= 16
+    pdf.save()
 
 class ProfessionalEnergyAudit:
+    # Pomocné texty pre polia (tooltip)
+    _FIELD_HELP = {
+        "floor_area": "Podlahová plocha všetkých vykurovaných priestorov",
+        "volume": "Obostavaný priestor = podlahová plocha × výška",
+        "construction_year": "Rok dokončenia výstavby budovy",
+        "building_height": "Priemerná výška budovy od základov po strechu"
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🏢 Profesionálny Energetický Audit | STN EN 16247")
@@ -22,13 +139,48 @@ class ProfessionalEnergyAudit:
         self.audit_data = {}
         self.results = {}
         self.validation_errors = []
+        self.fields = {}
+        self._required_fields = set()
+        self._dirty = False
+        self._autosave_job = None
+        self._last_saved_hash = None
+        self._validate_jobs = {}
+        self._pending_jobs = set()
+        self.project_file = None
+        
+        # Ukladanie/načítanie na pozadí, aby GUI nezamŕzalo; jeden pracovník
+        # zoradí úlohy, takže dva zápisy do rovnakého súboru sa neprekrývajú
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='audit-io')
+        self._io_futures = set()
+        self._closing = False
+        
+        # Navigácia: sekcia -> zobrazovacia metóda
+        self._nav_dispatch = {
+            "welcome": self.show_welcome_screen,
+            "basic_info": self.show_basic_info_form,
+            "envelope": functools.partial(self._show_not_implemented, "Obálka budovy"),
+            "heating": functools.partial(self._show_not_implemented, "Vykurovanie"),
+            "cooling": functools.partial(self._show_not_implemented, "Chladenie/Vetranie"),
+            "lighting": functools.partial(self._show_not_implemented, "Osvetlenie"),
+            "dhw": functools.partial(self._show_not_implemented, "Teplá voda"),
+            "usage": functools.partial(self._show_not_implemented, "Užívanie"),
+            "validation": functools.partial(self._show_not_implemented, "Validácia"),
+            "results": functools.partial(self._show_not_implemented, "Výsledky"),
+            "certificate": functools.partial(self._show_not_implemented, "Certifikát"),
+        }
+        self._active_section = None
+        
+        # Raz vytvorené sekcie sa pri navigácii len skrývajú/zobrazujú
+        self._section_frames = {}
+        self._current_frame = None
         
         # Štýlovanie
         self.setup_styles()
         self.create_professional_gui()
         
-        # Auto-save každých 5 minút
-        self.root.after(300000, self.auto_save)
+        # Auto-save každých 5 minút (len ak sa niečo zmenilo) a hodiny v hlavičke
+        self._start_timers()
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
         
     def setup_styles(self):
         """Nastavenie profesionálnych štýlov"""
@@ -43,6 +195,21 @@ class ProfessionalEnergyAudit:
         style.configure('Warning.TButton', background='#f39c12')
         style.configure('Danger.TButton', background='#e74c3c')
         
+        # Zdieľané fonty (Tk nemusí pri každom widgete parsovať popis fontu)
+        self._title_font = tkfont.Font(family='Arial', size=18, weight='bold')
+        self._heading_font = tkfont.Font(family='Arial', size=12, weight='bold')
+        self._nav_font = tkfont.Font(family='Arial', size=11)
+        self._entry_font = tkfont.Font(family='Arial', size=10)
+        self._label_font = self._entry_font
+        
+        # Navigačné tlačidlá - farby stavov rieši Tk (bez Python väzieb)
+        style.configure('Nav.TButton', background='#34495e', foreground='white',
+                        font=self._nav_font, anchor='w', padding=(20, 10), relief='flat')
+        style.map('Nav.TButton', background=[('pressed', '#2c3e50'), ('active', '#4a6741')])
+        style.configure('NavActive.TButton', background='#2c3e50', foreground='white',
+                        font=self._nav_font, anchor='w', padding=(20, 10), relief='sunken')
+        style.map('NavActive.TButton', background=[('active', '#4a6741')])
+        
     def create_professional_gui(self):
         """Vytvorenie profesionálneho GUI"""
         
@@ -69,11 +236,11 @@ class ProfessionalEnergyAudit:
         left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=20, pady=10)
         
         title_label = tk.Label(left_frame, text="🏢 PROFESIONÁLNY ENERGETICKÝ AUDIT", 
-                              font=('Arial', 18, 'bold'), fg='white', bg='#2c3e50')
+                              font=self._title_font, fg='white', bg='#2c3e50')
         title_label.pack()
         
         subtitle_label = tk.Label(left_frame, text="Systém pre energetické audity podľa STN EN 16247-1", 
-                                 font=('Arial', 10), fg='#bdc3c7', bg='#2c3e50')
+                                 font=self._label_font, fg='#bdc3c7', bg='#2c3e50')
         subtitle_label.pack()
         
         # Pravá strana - informácie o projekte
@@ -81,12 +248,22 @@ class ProfessionalEnergyAudit:
         right_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=20, pady=10)
         
         self.project_info = tk.Label(right_frame, text="Nový projekt", 
-                                    font=('Arial', 12, 'bold'), fg='#ecf0f1', bg='#2c3e50')
+                                    font=self._heading_font, fg='#ecf0f1', bg='#2c3e50')
         self.project_info.pack(anchor=tk.E)
         
-        date_label = tk.Label(right_frame, text=f"📅 {datetime.now().strftime('%d.%m.%Y %H:%M')}", 
-                             font=('Arial', 10), fg='#bdc3c7', bg='#2c3e50')
-        date_label.pack(anchor=tk.E)
+        self._date_label = tk.Label(right_frame, font=self._label_font, fg='#bdc3c7', bg='#2c3e50')
+        self._date_label.pack(anchor=tk.E)
+        self._last_date_str = ''
+        
+    def _tick_clock(self):
+        """Aktualizácia dátumu a času v hlavičke (raz za minútu)"""
+        now = datetime.now()
+        date_str = now.strftime('%d.%m.%Y %H:%M')
+        if date_str != self._last_date_str:
+            self._date_label.config(text=f"📅 {date_str}")
+            self._last_date_str = date_str
+        # Ďalší tik na začiatku nasledujúcej minúty
+        self._schedule((60 - now.second) * 1000, self._tick_clock)
         
     def create_main_content(self):
         """Hlavný obsah s bočným panelom"""
@@ -111,37 +288,16 @@ class ProfessionalEnergyAudit:
         
         # Nadpis navigácie
         nav_title = tk.Label(nav_frame, text="📋 NAVIGÁCIA", 
-                            font=('Arial', 12, 'bold'), fg='white', bg='#34495e')
+                            font=self._heading_font, fg='white', bg='#34495e')
         nav_title.pack(pady=(10, 20))
         
         # Navigačné tlačidlá
         self.nav_buttons = {}
-        nav_items = [
-            ("🏠", "Úvod", "welcome"),
-            ("🏢", "Základné údaje", "basic_info"),
-            ("🧱", "Obálka budovy", "envelope"),
-            ("🔥", "Vykurovanie", "heating"),
-            ("❄️", "Chladenie/Vetranie", "cooling"),
-            ("💡", "Osvetlenie", "lighting"),
-            ("🚿", "Teplá voda", "dhw"),
-            ("👥", "Užívanie", "usage"),
-            ("🔍", "Validácia", "validation"),
-            ("📊", "Výsledky", "results"),
-            ("🏅", "Certifikát", "certificate")
-        ]
-        
-        for icon, label, key in nav_items:
-            btn = tk.Button(nav_frame, text=f"{icon} {label}", 
-                           command=lambda k=key: self.navigate_to(k),
-                           bg='#34495e', fg='white', relief=tk.FLAT,
-                           font=('Arial', 11), width=30, height=2,
-                           anchor=tk.W, padx=20)
+        for icon, label, key in _NAV_ITEMS:
+            btn = ttk.Button(nav_frame, text=f"{icon} {label}", style='Nav.TButton',
+                            command=lambda k=key: self.navigate_to(k))
             btn.pack(fill=tk.X, pady=2, padx=10)
             self.nav_buttons[key] = btn
-            
-            # Hover efekt
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg='#4a6741'))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg='#34495e'))
         
         # SPODNÝ PANEL NAVIGÁCIE - AKČNÉ TLAČIDLÁ
         actions_frame = tk.Frame(nav_frame, bg='#34495e')
@@ -157,14 +313,8 @@ class ProfessionalEnergyAudit:
         self.main_action_btn.pack(fill=tk.X, padx=10, pady=5)
         
         # OSTATNÉ AKCIE
-        action_buttons = [
-            ("💾 Uložiť", self.save_project, '#3498db'),
-            ("📂 Načítať", self.load_project, '#9b59b6'),
-            ("📄 Export PDF", self.export_pdf, '#e67e22'),
-        ]
-        
-        for text, command, color in action_buttons:
-            btn = tk.Button(actions_frame, text=text, command=command,
+        for text, method, color in _ACTION_BUTTONS:
+            btn = tk.Button(actions_frame, text=text, command=getattr(self, method),
                            bg=color, fg='white', font=('Arial', 10, 'bold'),
                            height=2)
             btn.pack(fill=tk.X, padx=10, pady=2)
@@ -184,7 +334,7 @@ class ProfessionalEnergyAudit:
         file_menu.add_separator()
         file_menu.add_command(label="Export PDF", command=self.export_pdf)
         file_menu.add_separator()
-        file_menu.add_command(label="Ukončiť", command=self.root.quit)
+        file_menu.add_command(label="Ukončiť", command=self._on_close)
         
         # Nástroje menu
         tools_menu = tk.Menu(menubar, tearoff=0)
@@ -217,49 +367,52 @@ class ProfessionalEnergyAudit:
         
     def navigate_to(self, section):
         """Navigácia medzi sekciami"""
-        self.clear_content()
+        self._hide_current()
         self.update_navigation_style(section)
         
-        if section == "welcome":
-            self.show_welcome_screen()
-        elif section == "basic_info":
-            self.show_basic_info_form()
-        elif section == "envelope":
-            self.show_envelope_form()
-        elif section == "heating":
-            self.show_heating_form()
-        elif section == "cooling":
-            self.show_cooling_form()
-        elif section == "lighting":
-            self.show_lighting_form()
-        elif section == "dhw":
-            self.show_dhw_form()
-        elif section == "usage":
-            self.show_usage_form()
-        elif section == "validation":
-            self.show_validation()
-        elif section == "results":
-            self.show_results()
-        elif section == "certificate":
-            self.show_certificate()
+        handler = self._nav_dispatch.get(section)
+        if handler:
+            handler()
             
     def update_navigation_style(self, active_section):
-        """Aktualizácia štýlu navigácie"""
-        for key, btn in self.nav_buttons.items():
-            if key == active_section:
-                btn.config(bg='#2c3e50', relief=tk.SUNKEN)
-            else:
-                btn.config(bg='#34495e', relief=tk.FLAT)
+        """Aktualizácia štýlu navigácie (mení sa len predchádzajúce a nové tlačidlo)"""
+        previous = self.nav_buttons.get(self._active_section)
+        if previous is not None:
+            previous.configure(style='Nav.TButton')
+        current = self.nav_buttons.get(active_section)
+        if current is not None:
+            current.configure(style='NavActive.TButton')
+        self._active_section = active_section
                 
-    def clear_content(self):
-        """Vyčistenie obsahu"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def _hide_current(self):
+        """Skrytie aktuálne zobrazenej sekcie"""
+        if self._current_frame is not None:
+            self._current_frame.pack_forget()
+            self._current_frame = None
+            
+    def _show_section(self, key, builder, pad):
+        """Zobrazenie sekcie, pri prvej návšteve sa vytvorí"""
+        frame = self._section_frames.get(key)
+        if frame is None:
+            frame = self._section_frames[key] = builder()
+        frame.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
+        self._current_frame = frame
+        
+    def _drop_form_sections(self):
+        """Zahodenie uložených formulárov (nový/načítaný projekt)"""
+        self._hide_current()
+        for key in [k for k in self._section_frames if k != "welcome"]:
+            self._section_frames.pop(key).destroy()
+        self.fields.clear()
+        self._required_fields.clear()
             
     def show_welcome_screen(self):
         """Úvodná obrazovka"""
+        self._show_section("welcome", self._build_welcome_screen, 30)
+        
+    def _build_welcome_screen(self):
+        """Vytvorenie úvodnej obrazovky"""
         welcome_frame = tk.Frame(self.content_frame, bg='white')
-        welcome_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
         
         # Hlavný nadpis
         title = tk.Label(welcome_frame, text="Vitajte v Profesionálnom Energetickom Audite", 
@@ -294,15 +447,8 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         buttons_frame = tk.Frame(quick_frame, bg='white')
         buttons_frame.pack(pady=20)
         
-        quick_actions = [
-            ("🆕 Nový projekt", self.new_project, '#27ae60'),
-            ("📂 Otvoriť existujúci", self.load_project, '#3498db'),
-            ("📚 Príručka", self.show_help, '#9b59b6'),
-            ("🧮 Kalkulačky", self.u_value_calculator, '#f39c12')
-        ]
-        
-        for i, (text, command, color) in enumerate(quick_actions):
-            btn = tk.Button(buttons_frame, text=text, command=command,
+        for i, (text, method, color) in enumerate(_QUICK_ACTIONS):
+            btn = tk.Button(buttons_frame, text=text, command=getattr(self, method),
                            bg=color, fg='white', font=('Arial', 12, 'bold'),
                            width=20, height=2)
             btn.grid(row=i//2, column=i%2, padx=10, pady=5)
@@ -315,15 +461,19 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         info_label = tk.Label(info_frame, text=info_text, font=('Arial', 11), 
                              bg='#ecf0f1', fg='#2c3e50')
         info_label.pack(pady=10)
+        return welcome_frame
         
     def show_basic_info_form(self):
         """Formulár pre základné informácie"""
+        self._show_section("basic_info", self._build_basic_info_form, 20)
+        
+    def _build_basic_info_form(self):
+        """Vytvorenie formulára pre základné informácie"""
         form_frame = tk.Frame(self.content_frame, bg='white')
-        form_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Nadpis
         title = tk.Label(form_frame, text="🏢 ZÁKLADNÉ ÚDAJE O BUDOVE", 
-                        font=('Arial', 18, 'bold'), bg='white', fg='#2c3e50')
+                        font=self._title_font, bg='white', fg='#2c3e50')
         title.pack(pady=(0, 20))
         
         # Scrollable area
@@ -350,7 +500,7 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         # TECHNICKÉ PARAMETRE
         self.create_form_section(scrollable_frame, "📐 Technické parametre", [
             ("Rok výstavby *", "construction_year", "number", True),
-            ("Rok rekonštrukcie", "renovation_year", "number"),
+            ("Rok rekonštrukcie", "renovation_year", "number", False),
             ("Počet podlaží *", "floors_count", "number", True),
             ("Výška budovy [m] *", "building_height", "decimal", True),
             ("Podlahová plocha [m²] *", "floor_area", "decimal", True),
@@ -367,10 +517,11 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         
         # Validácia v reálnom čase
         self.setup_realtime_validation()
+        return form_frame
         
     def create_form_section(self, parent, title, fields):
         """Vytvorenie sekcie formulára"""
-        section_frame = tk.LabelFrame(parent, text=title, font=('Arial', 12, 'bold'), 
+        section_frame = tk.LabelFrame(parent, text=title, font=self._heading_font, 
                                      bg='white', fg='#2c3e50')
         section_frame.pack(fill=tk.X, padx=10, pady=10)
         
@@ -385,50 +536,46 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         label_frame = tk.Frame(parent, bg='white')
         label_frame.grid(row=row, column=0, sticky=tk.W, padx=10, pady=5)
         
-        label = tk.Label(label_frame, text=label_text, bg='white', font=('Arial', 10))
+        label = tk.Label(label_frame, text=label_text, bg='white', font=self._label_font)
         label.pack(side=tk.LEFT)
         
         if required:
             req_label = tk.Label(label_frame, text="*", bg='white', fg='red', 
-                                font=('Arial', 12, 'bold'))
+                                font=self._heading_font)
             req_label.pack(side=tk.LEFT)
         
-        # Input field
+        # Input field (text/email/number/decimal sú rovnaké Entry polia)
         if field_type == "combo":
             values = field_info[5] if len(field_info) > 5 else []
             widget = ttk.Combobox(parent, values=values, width=30)
-        elif field_type == "text":
-            widget = tk.Entry(parent, width=32, font=('Arial', 10))
-        elif field_type == "email":
-            widget = tk.Entry(parent, width=32, font=('Arial', 10))
-        elif field_type == "number":
-            widget = tk.Entry(parent, width=32, font=('Arial', 10))
-        elif field_type == "decimal":
-            widget = tk.Entry(parent, width=32, font=('Arial', 10))
         else:
-            widget = tk.Entry(parent, width=32, font=('Arial', 10))
+            widget = tk.Entry(parent, width=32, font=self._entry_font)
+        
+        # Hodnota z projektu (formulár sa po načítaní vytvára nanovo)
+        value = self.audit_data.get(field_name)
+        if value not in (None, ""):
+            if field_type == "combo":
+                widget.set(str(value))
+            else:
+                widget.insert(0, str(value))
             
         widget.grid(row=row, column=1, padx=10, pady=5, sticky=tk.W)
         
         # Uloženie referencie
-        setattr(self, field_name, widget)
+        self.fields[field_name] = widget
+        if required:
+            self._required_fields.add(field_name)
         
-        # Validácia
+        # Validácia (povinné polia), inak len zaznamenanie zmeny
         if required:
-            widget.bind('<KeyRelease>', lambda e, fn=field_name: self.validate_field(fn))
+            widget.bind('<KeyRelease>', lambda e, fn=field_name: self._schedule_validate(fn))
+        else:
+            widget.bind('<KeyRelease>', lambda e, fn=field_name: self.mark_dirty(fn))
             
         # Help tooltip
-        if field_name in self.get_field_help():
-            self.create_tooltip(widget, self.get_field_help()[field_name])
-            
-    def get_field_help(self):
-        """Pomocné texty pre polia"""
-        return {
-            "floor_area": "Podlahová plocha všetkých vykurovaných priestorov",
-            "volume": "Obostavaný priestor = podlahová plocha × výška",
-            "construction_year": "Rok dokončenia výstavby budovy",
-            "building_height": "Priemerná výška budovy od základov po strechu"
-        }
+        help_text = self._FIELD_HELP.get(field_name)
+        if help_text:
+            self.create_tooltip(widget, help_text)
         
     def create_tooltip(self, widget, text):
         """Vytvorenie tooltip-u"""
@@ -448,81 +595,50 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         widget.bind('<Enter>', show_tooltip)
         widget.bind('<Leave>', hide_tooltip)
         
+    def _schedule_validate(self, field_name):
+        """Odložená validácia - spustí sa až po dopísaní (posledný kláves)"""
+        self._cancel(self._validate_jobs.get(field_name))
+        self._validate_jobs[field_name] = self._schedule(VALIDATE_DELAY_MS, self._run_validate, field_name)
+        
+    def _run_validate(self, field_name):
+        """Spustenie naplánovanej validácie"""
+        self._validate_jobs.pop(field_name, None)
+        self.validate_field(field_name)
+        
     def validate_field(self, field_name):
         """Validácia jednotlivého poľa"""
-        widget = getattr(self, field_name)
+        widget = self.fields[field_name]
         value = widget.get().strip()
+        self.mark_dirty(field_name, value)
         
         # Reset štýlu
         widget.config(bg='white')
         
         # Validácia podľa typu
-        valid = True
-        if field_name in ['construction_year', 'floors_count']:
-            try:
-                int_val = int(value) if value else 0
-                if field_name == 'construction_year' and (int_val < 1800 or int_val > 2030):
-                    valid = False
-                elif field_name == 'floors_count' and (int_val < 1 or int_val > 100):
-                    valid = False
-            except ValueError:
-                valid = False
-                
-        elif field_name in ['floor_area', 'volume', 'building_height']:
-            try:
-                float_val = float(value) if value else 0
-                if float_val <= 0:
-                    valid = False
-            except ValueError:
-                valid = False
-                
+        valid = _parse_and_check(field_name, value, field_name in self._required_fields)
+        
         # Zvýraznenie chýb
-        if not valid and value:
+        if not valid:
             widget.config(bg='#ffcccc')
         elif value:
             widget.config(bg='#ccffcc')
             
+    def mark_dirty(self, field_name, value=None):
+        """Zaznamenanie zmeny poľa pre auto-save"""
+        if value is None:
+            value = self.fields[field_name].get().strip()
+        if self.audit_data.get(field_name) != value:
+            self.audit_data[field_name] = value
+            self._dirty = True
+            
     def setup_realtime_validation(self):
         """Nastavenie validácie v reálnom čase"""
         # Implementované v create_form_field
         pass
         
-    def show_envelope_form(self):
-        """Formulár pre obálku budovy"""
-        # Podobne ako basic_info_form, ale pre obálku budovy
-        messagebox.showinfo("Info", "Formulár pre obálku budovy bude implementovaný...")
-        
-    def show_heating_form(self):
-        """Formulár pre vykurovanie"""
-        messagebox.showinfo("Info", "Formulár pre vykurovanie bude implementovaný...")
-        
-    def show_cooling_form(self):
-        """Formulár pre chladenie"""
-        messagebox.showinfo("Info", "Formulár pre chladenie bude implementovaný...")
-        
-    def show_lighting_form(self):
-        """Formulár pre osvetlenie"""
-        messagebox.showinfo("Info", "Formulár pre osvetlenie bude implementovaný...")
-        
-    def show_dhw_form(self):
-        """Formulár pre teplú vodu"""
-        messagebox.showinfo("Info", "Formulár pre teplú vodu bude implementovaný...")
-        
-    def show_usage_form(self):
-        """Formulár pre užívanie"""
-        messagebox.showinfo("Info", "Formulár pre užívanie bude implementovaný...")
-        
-    def show_validation(self):
-        """Zobrazenie validácie"""
-        messagebox.showinfo("Info", "Validácia údajov bude implementovaná...")
-        
-    def show_results(self):
-        """Zobrazenie výsledkov"""
-        messagebox.showinfo("Info", "Výsledky budú implementované...")
-        
-    def show_certificate(self):
-        """Zobrazenie certifikátu"""
-        messagebox.showinfo("Info", "Certifikát bude implementovaný...")
+    def _show_not_implemented(self, section):
+        """Spoločná obrazovka pre zatiaľ neimplementované sekcie"""
+        messagebox.showinfo("Info", f"Sekcia '{section}' bude implementovaná...")
         
     def perform_professional_audit(self):
         """Vykonanie profesionálneho auditu"""
@@ -532,51 +648,138 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
             return
             
         self.status_text.config(text="Prebieha audit...")
-        self.progress['value'] = 0
-        
-        try:
-            # Simulácia postupného auditu
-            for i in range(0, 101, 10):
-                self.progress['value'] = i
-                self.root.update()
-                self.root.after(100)  # 100ms delay
-                
-            self.status_text.config(text="Audit dokončený úspešne!")
-            messagebox.showinfo("Úspech", "✅ Profesionálny energetický audit dokončený!")
+        self.main_action_btn.config(state=tk.DISABLED)
+        self._audit_step(0)
+        
+    def _audit_step(self, i):
+        """Krok priebehu auditu (plánovaný cez after, bez blokovania GUI)"""
+        self.progress['value'] = i
+        if i >= 100:
+            self._finish_audit()
+        else:
+            self._schedule(100, self._audit_step, i + 10)
             
-        except Exception as e:
-            messagebox.showerror("Chyba", f"Chyba pri audite: {e}")
-        finally:
-            self.progress['value'] = 0
+    def _finish_audit(self):
+        """Dokončenie auditu"""
+        self.main_action_btn.config(state=tk.NORMAL)
+        self.status_text.config(text="Audit dokončený úspešne!")
+        messagebox.showinfo("Úspech", "✅ Profesionálny energetický audit dokončený!")
+        self.progress['value'] = 0
             
     def validate_all_data(self):
         """Validácia všetkých údajov"""
-        # Implementácia komplexnej validácie
-        return True  # Dočasne
+        return all(_parse_and_check(fn, w.get().strip(), fn in self._required_fields)
+                   for fn, w in self.fields.items())
         
     def new_project(self):
         """Nový projekt"""
         if messagebox.askyesno("Nový projekt", "Chcete vytvoriť nový projekt? Neuložené zmeny sa stratia."):
+            self._reset_session()
             self.audit_data = {}
             self.results = {}
+            self.project_file = None
+            self._drop_form_sections()
             self.project_info.config(text="Nový projekt")
             self.navigate_to("welcome")
             
+    def _run_io(self, task, args, on_success, error_message):
+        """Spustenie I/O na pozadí, výsledok sa spracuje v hlavnom vlákne"""
+        self.status_text.config(text="Prebieha práca so súborom...")
+        future = self._io_pool.submit(task, *args)
+        self._io_futures.add(future)
+        future.add_done_callback(
+            lambda f: self._io_done(f, on_success, error_message))
+        
+    def _io_done(self, future, on_success, error_message):
+        """Odovzdanie výsledku I/O hlavnému vláknu (po zatvorení okna sa zahodí)"""
+        self._io_futures.discard(future)
+        if self._closing or future.cancelled():
+            return
+        try:
+            self.root.after(0, self._finish_io, future, on_success, error_message)
+        except (tk.TclError, RuntimeError):
+            # Okno sa zatvorilo medzi kontrolou a naplánovaním
+            pass
+        
+    def _finish_io(self, future, on_success, error_message):
+        """Dokončenie I/O na pozadí"""
+        error = future.exception()
+        if error is not None:
+            self.status_text.config(text=error_message)
+            messagebox.showerror("Chyba", f"{error_message}: {error}")
+        else:
+            on_success(future.result())
+            
     def save_project(self):
         """Uloženie projektu"""
-        messagebox.showinfo("Info", "Ukladanie projektu bude implementované...")
+        if not self.project_file:
+            self.save_as_project()
+            return
+        
+        filename = self.project_file
+        self._run_io(_write_json, (filename, dict(self.audit_data)),
+                     lambda _: self._on_project_saved(filename),
+                     "Chyba pri ukladaní")
+        
+    def _on_project_saved(self, filename):
+        """Projekt bol uložený"""
+        self._dirty = False
+        self.restart_autosave()
+        self.project_info.config(text=os.path.basename(filename))
+        self.status_text.config(text=f"Projekt uložený: {filename}")
         
     def save_as_project(self):
         """Uloženie projektu ako"""
-        messagebox.showinfo("Info", "Ukladanie ako bude implementované...")
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON súbory", "*.json"), ("Všetky súbory", "*.*")],
+            title="Uložiť projekt"
+        )
+        if filename:
+            self.project_file = filename
+            self.save_project()
         
     def load_project(self):
         """Načítanie projektu"""
-        messagebox.showinfo("Info", "Načítanie projektu bude implementované...")
+        from tkinter import filedialog
+        filename = filedialog.askopenfilename(
+            filetypes=[("JSON súbory", "*.json"), ("Všetky súbory", "*.*")],
+            title="Načítať projekt"
+        )
+        if filename:
+            self._run_io(_read_json, (filename,),
+                         lambda data: self._on_project_loaded(filename, data),
+                         "Chyba pri načítaní")
+            
+    def _on_project_loaded(self, filename, data):
+        """Projekt bol načítaný"""
+        self._reset_session()
+        self.audit_data = data
+        self.results = {}
+        self.project_file = filename
+        self._dirty = False
+        self._drop_form_sections()
+        self.navigate_to("welcome")
+        self.project_info.config(text=os.path.basename(filename))
+        self.status_text.config(text=f"Projekt načítaný: {filename}")
         
     def export_pdf(self):
         """Export do PDF"""
-        messagebox.showinfo("Info", "Export do PDF bude implementovaný...")
+        if not REPORTLAB_AVAILABLE:
+            messagebox.showwarning("Upozornenie", "Export do PDF vyžaduje knižnicu reportlab (pip install reportlab).")
+            return
+        
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF súbory", "*.pdf")],
+            title="Exportovať do PDF"
+        )
+        if filename:
+            self._run_io(_write_pdf, (filename, dict(self.audit_data)),
+                         lambda _: self.status_text.config(text=f"PDF exportované: {filename}"),
+                         "Chyba pri exporte PDF")
         
     def u_value_calculator(self):
         """Kalkulačka U-hodnôt"""
@@ -598,6 +801,8 @@ Táto aplikácia vám umožní vykonať komplexný energetický audit budovy v s
         
     def show_help(self):
         """Zobrazenie pomoci"""
+        from tkinter import scrolledtext
+        
         help_window = tk.Toplevel(self.root)
         help_window.title("📚 Používateľská príručka")
         help_window.geometry("800x600")
@@ -673,15 +878,79 @@ Dátum: 2024
         """)
         
     def auto_save(self):
-        """Automatické ukladanie"""
-        if self.audit_data:
+        """Automatické ukladanie (zapisuje len pri neuložených zmenách)"""
+        if self._dirty and self.audit_data:
             try:
-                # Auto-save logika
-                pass
-            except:
+                self._write_autosave()
+                self._dirty = False
+            except OSError:
                 pass
         # Naplánovanie ďalšieho auto-save
-        self.root.after(300000, self.auto_save)
+        self._autosave_job = self._schedule(AUTOSAVE_INTERVAL_MS, self.auto_save)
+        
+    def restart_autosave(self):
+        """Reštart časovača auto-save (napr. po manuálnom uložení)"""
+        self._cancel(self._autosave_job)
+        self._autosave_job = self._schedule(AUTOSAVE_INTERVAL_MS, self.auto_save)
+        
+    def _schedule(self, ms, func, *args):
+        """Naplánovanie úlohy cez after s evidenciou (aby sa dala zrušiť)"""
+        def run():
+            self._pending_jobs.discard(job)
+            func(*args)
+        job = self.root.after(ms, run)
+        self._pending_jobs.add(job)
+        return job
+        
+    def _cancel(self, job):
+        """Zrušenie jednej naplánovanej úlohy"""
+        if job and job in self._pending_jobs:
+            self._pending_jobs.discard(job)
+            self.root.after_cancel(job)
+            
+    def _cancel_all(self):
+        """Zrušenie všetkých naplánovaných úloh"""
+        for job in self._pending_jobs:
+            self.root.after_cancel(job)
+        self._pending_jobs.clear()
+        self._validate_jobs.clear()
+        self._autosave_job = None
+        
+    def _start_timers(self):
+        """Spustenie periodických úloh (auto-save, hodiny)"""
+        self._autosave_job = self._schedule(AUTOSAVE_INTERVAL_MS, self.auto_save)
+        self._tick_clock()
+        
+    def _reset_session(self):
+        """Zrušenie úloh starého projektu (auto-save, validácia, audit) a nový štart"""
+        self._cancel_all()
+        self.main_action_btn.config(state=tk.NORMAL)
+        self.progress['value'] = 0
+        self._start_timers()
+        
+    def _on_close(self):
+        """Ukončenie aplikácie bez visiacich after úloh"""
+        self._closing = True
+        self._cancel_all()
+        # Čakajúce I/O úlohy sa zrušia; bežiaca dobehne bez volania do zničeného okna
+        for future in list(self._io_futures):
+            future.cancel()
+        self._io_pool.shutdown(wait=False)
+        self.root.destroy()
+        
+    def _write_autosave(self):
+        """Zápis auto-save súboru (preskočí sa, ak sa obsah nezmenil)"""
+        data = json.dumps(self.audit_data, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self._last_saved_hash:
+            return
+        
+        # Atomický zápis - pri páde ostane celý predchádzajúci súbor
+        tmp_file = AUTOSAVE_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, AUTOSAVE_FILE)
+        self._last_saved_hash = digest
 
 def main():
     """Spustenie aplikácie"""
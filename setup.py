@@ -2,12 +2,24 @@
 Setup script pre Energy Audit Desktop Application
 """
 
+import functools
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Načítanie obsahu README súboru
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _long_desc():
+    """Obsah README súboru (číta sa raz na proces)"""
+    return (this_directory / "README.md").read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _pkgs():
+    """Balíčky v src/ (strom sa prechádza raz na proces)"""
+    return find_packages(where="src")
+
 
 setup(
     name="energy-audit-app",
@@ -15,10 +27,10 @@ setup(
     author="Energy Audit Team",
     author_email="team@energyaudit.local",
     description="Desktopová aplikácia na vykonávanie energetického auditu a certifikáciu budov",
-    long_description=long_description,
+    long_description=_long_desc(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/energy-audit-app",
-    packages=find_packages(where="src"),
+    packages=_pkgs(),
     package_dir={"": "src"},
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -35,23 +47,24 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "tkinter-modern>=1.4.4",
         "customtkinter>=5.2.2",
         "pandas>=2.1.4",
         "numpy>=1.24.3",
-        "openpyxl>=3.1.2",
-        "reportlab>=4.0.7",
-        "matplotlib>=3.7.2",
-        "configparser>=6.0.0",
         "pyyaml>=6.0.1",
         "loguru>=0.7.2",
         "python-dateutil>=2.8.2",
-        "pathlib2>=2.3.7",
     ],
     extras_require={
+        # PDF certifikáty a grafy - bez nich aplikácia beží so zníženou funkcionalitou
+        "reports": [
+            "reportlab>=4.0.7",
+            "matplotlib>=3.7.2",
+            "openpyxl>=3.1.2",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
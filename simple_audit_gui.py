@@ -4,12 +4,372 @@ JEDNODUCHÁ ENERGY AUDIT GUI APLIKÁCIA
 S jasne viditeľným tlačidlom VYKONAŤ AUDIT
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from datetime import datetime
+import bisect
+import dataclasses
+import operator
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+import numpy as np
+
+import audit_kernel
+
+# Horné hranice tried primárnej energie [kWh/m²rok] (hranica patrí ešte do triedy)
+_CLASS_THRESHOLDS = (50, 75, 110, 150, 200, 250)
+_CLASSES = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+
+# Pravidlá odporúčaní: (sekcia, parameter, porovnanie, hranica, text)
+_RECOMMENDATION_RULES = (
+    ('envelope', 'wall_u', operator.gt, 0.30, "• Zateplenie stien (úspory 25-35%)"),
+    ('envelope', 'window_u', operator.gt, 2.0, "• Výmena okien (úspory 15-20%)"),
+    ('systems', 'heating_efficiency', operator.lt, 0.85, "• Modernizácia vykurovania (úspory 20-30%)"),
+)
+
+# Stupňové dni vykurovania (Bratislava)
+_HDD = 2800
+
+# Poradie výstupov audit_kernel.compute
+_KERNEL_OUTPUTS = (
+    'wall_losses', 'window_losses', 'total_losses', 'heating_need', 'heating_energy',
+    'electricity', 'total_energy', 'primary_energy', 'specific_primary',
+    'co2_emissions', 'specific_co2',
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class AuditResults:
+    """Výsledky auditu jednej budovy (__slots__ ručne - slots=True vyžaduje Python 3.10)"""
+    __slots__ = _KERNEL_OUTPUTS + ('energy_class',)
+    
+    wall_losses: float
+    window_losses: float
+    total_losses: float
+    heating_need: float
+    heating_energy: float
+    electricity: float
+    total_energy: float
+    primary_energy: float
+    specific_primary: float
+    co2_emissions: float
+    specific_co2: float
+    energy_class: str
+
+
+def _recommendations(envelope, systems):
+    """Odporúčania podľa tabuľky _RECOMMENDATION_RULES (čistá funkcia bez GUI)"""
+    data = {'envelope': envelope, 'systems': systems}
+    return [
+        text for section, key, compare, limit, text in _RECOMMENDATION_RULES
+        if compare(data[section][key], limit)
+    ]
+
+
+def compute_audit(arrays):
+    """
+    Výpočet energetickej bilancie nad poľami (SoA) - jedna alebo viac budov
+    
+    Args:
+        arrays: Slovník polí floor_area, wall_area, wall_u, window_area,
+                window_u a heating_efficiency (rovnakej dĺžky)
+    """
+    values = audit_kernel.compute(
+        arrays['wall_area'], arrays['wall_u'], arrays['window_area'], arrays['window_u'],
+        arrays['floor_area'], arrays['heating_efficiency'], _HDD
+    )
+    return dict(zip(_KERNEL_OUTPUTS, values))
+
+
+# Formulár: (nadpis sekcie, polia (kľúč, popis, predvolená hodnota[, možnosti výberu]))
+_FORM_SECTIONS = (
+    ("🏢 Základné údaje", (
+        ("building_name", "Názov budovy:", "Testovacia budova"),
+        ("floor_area", "Podlahová plocha [m²]:", "120"),
+        ("construction_year", "Rok výstavby:", "2000"),
+    )),
+    ("🏠 Obálka budovy", (
+        ("wall_area", "Plocha stien [m²]:", "150"),
+        ("wall_u", "U-hodnota stien [W/m²K]:", "0.25"),
+        ("window_area", "Plocha okien [m²]:", "25"),
+        ("window_u", "U-hodnota okien [W/m²K]:", "1.1"),
+    )),
+    ("⚙️ Systémy", (
+        ("heating_type", "Typ vykurovania:", "Plynový kotol",
+         ("Plynový kotol", "Elektrické", "Tepelné čerpadlo")),
+        ("heating_efficiency", "Účinnosť vykurovania [%]:", "90"),
+    )),
+)
+
+# Typy, predvolené hodnoty (pre prázdne pole) a povolený rozsah vstupov:
+# pole formulára -> (sekcia, kľúč v audit_data, typ, predvolená hodnota, rozsah)
+_SCHEMA = {
+    'building_name': ('building', 'name', str, "Test budova", None),
+    'floor_area': ('building', 'floor_area', float, 120.0, (1, 1e6)),
+    'construction_year': ('building', 'construction_year', int, 2000, (1800, 2100)),
+    'wall_area': ('envelope', 'wall_area', float, 150.0, (0, 1e6)),
+    'wall_u': ('envelope', 'wall_u', float, 0.25, (0.05, 10)),
+    'window_area': ('envelope', 'window_area', float, 25.0, (0, 1e6)),
+    'window_u': ('envelope', 'window_u', float, 1.1, (0.3, 10)),
+    'heating_type': ('systems', 'heating_type', str, "Plynový kotol", None),
+    'heating_efficiency': ('systems', 'heating_efficiency', float, 90.0, (1, 500)),  # %
+}
+
+
+# Spoločná hlavička budovy pre výsledky aj detailné výpočty
+_SUMMARY_BLOCK = """🏢 BUDOVA: {name}
+📐 Podlahová plocha: {floor_area:.0f} m²
+"""
+
+# Text výsledkov auditu (format_map: údaje budovy + výsledky + odporúčania)
+_RESULTS_TEMPLATE = """
+{sep}
+📋 ENERGETICKÝ AUDIT - VÝSLEDKY
+{sep}
+
+""" + _SUMMARY_BLOCK + """📅 Rok výstavby: {construction_year}
+
+⚡ ENERGETICKÁ BILANCIA:
+├─ Vykurovanie: {heating_energy:.0f} kWh/rok
+├─ Elektrina: {electricity:.0f} kWh/rok  
+└─ CELKOM: {total_energy:.0f} kWh/rok
+
+🎯 ENERGETICKÉ HODNOTENIE:
+├─ Energetická trieda: {energy_class}
+├─ Primárna energia: {specific_primary:.1f} kWh/m²rok
+├─ CO2 emisie: {specific_co2:.1f} kg/m²rok
+└─ Tepelné straty: {total_losses:.1f} W/K
+
+💡 ODPORÚČANIA:
+{recommendations}
+
+📋 CERTIFIKÁCIA:
+🏅 Energetická trieda: {energy_class}
+⚡ Primárna energia: {specific_primary:.1f} kWh/m²rok
+🌍 CO2 emisie: {specific_co2:.1f} kg CO2/m²rok
+"""
+
+# Text detailných výpočtov (format_map nad plochým slovníkom vstupov a výsledkov)
+_CALC_DETAILS_TEMPLATE = """
+{rule}
+🧮 DETAILNÉ VÝPOČTY ENERGETICKÉHO AUDITU
+{rule}
+
+📊 VSTUPNÉ ÚDAJE:
+{thin}
+🏢 Budova: {name}
+📐 Podlahová plocha (Af): {floor_area:.1f} m²
+📅 Rok výstavby: {construction_year}
+🧱 Plocha stien (Aw): {wall_area:.1f} m²
+🧱 U-hodnota stien (Uw): {wall_u:.3f} W/m²K
+🪟 Plocha okien (Aok): {window_area:.1f} m²
+🪟 U-hodnota okien (Uok): {window_u:.3f} W/m²K
+⚙️  Typ vykurovania: {heating_type}
+⚙️  Účinnosť vykurovania (ηh): {eff_pct:.1f}%
+
+{rule}
+📈 KROK 1: VÝPOČET TEPELNÝCH STRÁT
+{rule}
+
+📐 VZOREC: Tepelné straty = Súčet (Plocha × U-hodnota)
+
+🧱 Tepelné straty stenami:
+   Qw = Aw × Uw
+   Qw = {wall_area:.1f} m² × {wall_u:.3f} W/m²K
+   Qw = {wall_losses:.2f} W/K
+
+🪟 Tepelné straty oknami:
+   Qok = Aok × Uok
+   Qok = {window_area:.1f} m² × {window_u:.3f} W/m²K
+   Qok = {window_losses:.2f} W/K
+
+📊 CELKOVÉ TEPELNÉ STRATY:
+   Qtotal = Qw + Qok
+   Qtotal = {wall_losses:.2f} + {window_losses:.2f}
+   Qtotal = {total_losses:.2f} W/K
+
+{rule}
+📈 KROK 2: POTREBA TEPLA NA VYKUROVANIE
+{rule}
+
+📐 VZOREC: Qh = Qtotal × HDD × 24 / 1000
+   kde: HDD = Heating Degree Days (stupňové dni vykurovania)
+
+🌡️  Heating Degree Days (Bratislava): {hdd} K·deň/rok
+
+🔥 Potreba tepla na vykurovanie:
+   Qh = {total_losses:.2f} W/K × {hdd} K·deň/rok × 24 h/deň ÷ 1000
+   Qh = {heating_need:.0f} kWh/rok
+
+{rule}
+📈 KROK 3: SPOTREBA ENERGIE NA VYKUROVANIE
+{rule}
+
+📐 VZOREC: Eh = Qh / ηh
+   kde: ηh = účinnosť vykurovacieho systému
+
+⚙️  Spotreba energie na vykurovanie:
+   Eh = {heating_need:.0f} kWh/rok ÷ {heating_efficiency:.2f}
+   Eh = {heating_energy:.0f} kWh/rok
+
+{rule}
+📈 KROK 4: SPOTREBA ELEKTRICKEJ ENERGIE
+{rule}
+
+📐 VZOREC: Eel = Af × {el_m2:g} kWh/m²rok (štandardná hodnota)
+
+💡 Spotreba elektrickej energie:
+   Eel = {floor_area:.1f} m² × {el_m2:g} kWh/m²rok
+   Eel = {electricity:.0f} kWh/rok
+
+{rule}
+📈 KROK 5: CELKOVÁ SPOTREBA ENERGIE
+{rule}
+
+📐 VZOREC: Etotal = Eh + Eel
+
+⚡ Celková spotreba energie:
+   Etotal = {heating_energy:.0f} + {electricity:.0f}
+   Etotal = {total_energy:.0f} kWh/rok
+
+{rule}
+📈 KROK 6: PRIMÁRNA ENERGIA
+{rule}
+
+📐 VZOREC: Ep = Eh × fp,h + Eel × fp,el
+   kde: fp,h = faktor primárnej energie pre vykurovanie
+        fp,el = faktor primárnej energie pre elektrinu
+
+🔢 Faktory primárnej energie:
+   - Vykurovanie (plyn): fp,h = {fp_h}
+   - Elektrina: fp,el = {fp_el}
+
+🎯 Primárna energia:
+   Ep = {heating_energy:.0f} × {fp_h} + {electricity:.0f} × {fp_el}
+   Ep = {ep_heat:.0f} + {ep_el:.0f}
+   Ep = {primary_energy:.0f} kWh/rok
+
+📊 Špecifická primárna energia:
+   ep = Ep / Af
+   ep = {primary_energy:.0f} kWh/rok ÷ {floor_area:.1f} m²
+   ep = {specific_primary:.1f} kWh/m²rok
+
+{rule}
+📈 KROK 7: ENERGETICKÁ TRIEDA
+{rule}
+
+📐 KLASIFIKÁCIA PODĽA STN EN 16247:
+   A: ≤ 50 kWh/m²rok    (Veľmi úsporná)
+   B: ≤ 75 kWh/m²rok    (Úsporná)
+   C: ≤ 110 kWh/m²rok   (Vyhovujúca)
+   D: ≤ 150 kWh/m²rok   (Nevyhovujúca)
+   E: ≤ 200 kWh/m²rok   (Neúsporná)
+   F: ≤ 250 kWh/m²rok   (Veľmi neúsporná)
+   G: > 250 kWh/m²rok   (Mimoriadne neúsporná)
+
+🏅 HODNOTENIE:
+   Špecifická primárna energia: {specific_primary:.1f} kWh/m²rok
+   Energetická trieda: {energy_class}
+
+{rule}
+📈 KROK 8: CO2 EMISIE
+{rule}
+
+📐 VZOREC: CO2 = Eh × fCO2,h + Eel × fCO2,el
+   kde: fCO2,h = emisný faktor pre vykurovanie
+        fCO2,el = emisný faktor pre elektrinu
+
+🌍 Emisné faktory:
+   - Vykurovanie (plyn): fCO2,h = {fco2_h} kg CO2/kWh
+   - Elektrina: fCO2,el = {fco2_el} kg CO2/kWh
+
+🌱 CO2 emisie:
+   CO2 = {heating_energy:.0f} × {fco2_h} + {electricity:.0f} × {fco2_el}
+   CO2 = {co2_heat:.0f} + {co2_el:.0f}
+   CO2 = {co2_emissions:.0f} kg CO2/rok
+
+📊 Špecifické CO2 emisie:
+   co2 = CO2 / Af
+   co2 = {co2_emissions:.0f} kg CO2/rok ÷ {floor_area:.1f} m²
+   co2 = {specific_co2:.1f} kg CO2/m²rok
+
+{rule}
+📋 SÚHRN VÝSLEDKOV
+{rule}
+
+""" + _SUMMARY_BLOCK + """
+⚡ ENERGETICKÁ BILANCIA:
+├─ Potreba tepla: {heating_need:.0f} kWh/rok
+├─ Spotreba na vykurovanie: {heating_energy:.0f} kWh/rok
+├─ Spotreba elektrickej energie: {electricity:.0f} kWh/rok
+└─ CELKOVÁ SPOTREBA: {total_energy:.0f} kWh/rok
+
+🎯 ENERGETICKÉ HODNOTENIE:
+├─ Primárna energia: {primary_energy:.0f} kWh/rok
+├─ Špecifická primárna energia: {specific_primary:.1f} kWh/m²rok
+├─ Energetická trieda: {energy_class}
+└─ Tepelné straty: {total_losses:.2f} W/K
+
+🌍 ENVIRONMENTÁLNY DOPAD:
+├─ CO2 emisie: {co2_emissions:.0f} kg CO2/rok
+└─ Špecifické CO2 emisie: {specific_co2:.1f} kg CO2/m²rok
+
+{rule}
+📚 POUŽITÉ NORMY A ŠTANDARDY:
+{rule}
+
+• STN EN 16247-1: Energetické audity - Časť 1: Všeobecné požiadavky
+• STN EN ISO 13790: Energetická náročnosť budov
+• Vyhláška MH SR č. 364/2012 Z. z. o energetickej náročnosti budov
+• STN 73 0540: Tepelná ochrana budov
+
+📖 POZNÁMKY:
+• HDD hodnota 2800 K·deň/rok je typická pre Bratislavu
+• Faktory primárnej energie sú v súlade s platnou legislatívou SR
+• Emisné faktory zodpovedajú aktuálnym hodnotám pre SR
+• Štandardná spotreba elektrickej energie 15 kWh/m²rok pre obytné budovy
+"""
+
+# Dátumové reťazce certifikátu pre poslednú minútu: (číslo minúty, (číslo, vydanie, platnosť))
+_cert_stamp = (None, None)
+
+
+def _certificate_stamps():
+    """Číslo certifikátu, dátum vydania a platnosti (prepočet raz za minútu)"""
+    global _cert_stamp
+    minute = int(time.time() // 60)
+    if _cert_stamp[0] != minute:
+        from datetime import datetime
+        now = datetime.now()
+        try:
+            valid_until = now.replace(year=now.year + 10)
+        except ValueError:  # 29. február
+            valid_until = now.replace(year=now.year + 10, day=28)
+        _cert_stamp = (minute, (
+            f"EC-{now:%Y%m%d%H%M}",
+            f"{now:%d.%m.%Y}",
+            f"{valid_until:%d.%m.%Y}",
+        ))
+    return _cert_stamp[1]
+
+
+# tkinter sa načíta až pri vytváraní GUI, samotný import modulu ho nepotrebuje;
+# messagebox sa importuje až v obsluhe udalostí, ktorá zobrazuje dialóg
+tk = ttk = scrolledtext = None
+
+
+def _import_tk():
+    """Oneskorený import tkinter (pri prvom vytvorení GUI)"""
+    global tk, ttk, scrolledtext
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, scrolledtext
+
 
 class SimpleEnergyAuditGUI:
     def __init__(self, root):
+        _import_tk()
         self.root = root
         self.root.title("🏢 Energetický Audit Systém")
         self.root.geometry("1000x700")
@@ -17,13 +377,28 @@ class SimpleEnergyAuditGUI:
         
         # Dáta
         self.audit_data = {}
-        self.results = {}
+        self.results = None  # AuditResults po vykonaní auditu
+        self._results_data = None  # vstupy, z ktorých vznikli self.results
+        self._calc_details = None  # (kľúč, výsledky, text) detailných výpočtov
+        
+        # Výpočet auditu beží mimo hlavného vlákna Tk
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Okno detailných výpočtov (vytvorí sa pri prvom zobrazení)
+        self._calc_window = None
+        self._calc_text = None
+        self._calc_stream = 0
         
         self.create_gui()
         
     def create_gui(self):
         """Vytvorenie jednoduchého GUI"""
         
+        # Štýly formulára (farba a písmo sa nastavia raz pre všetky polia)
+        style = ttk.Style()
+        style.configure("Audit.TLabel", background="white", font=("Arial", 10))
+        style.configure("Audit.TEntry", fieldbackground="white")
+        
         # HLAVIČKY
         header = tk.Frame(self.root, bg='#2c3e50', height=60)
         header.pack(fill=tk.X)
@@ -67,62 +442,22 @@ class SimpleEnergyAuditGUI:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # 1. ZÁKLADNÉ ÚDAJE
-        basic_frame = tk.LabelFrame(scrollable_frame, text="🏢 Základné údaje", bg='white')
-        basic_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        tk.Label(basic_frame, text="Názov budovy:", bg='white').grid(row=0, column=0, sticky=tk.W, padx=5, pady=3)
-        self.building_name = tk.Entry(basic_frame, width=30)
-        self.building_name.grid(row=0, column=1, padx=5, pady=3)
-        self.building_name.insert(0, "Testovacia budova")
-        
-        tk.Label(basic_frame, text="Podlahová plocha [m²]:", bg='white').grid(row=1, column=0, sticky=tk.W, padx=5, pady=3)
-        self.floor_area = tk.Entry(basic_frame, width=30)
-        self.floor_area.grid(row=1, column=1, padx=5, pady=3)
-        self.floor_area.insert(0, "120")
-        
-        tk.Label(basic_frame, text="Rok výstavby:", bg='white').grid(row=2, column=0, sticky=tk.W, padx=5, pady=3)
-        self.construction_year = tk.Entry(basic_frame, width=30)
-        self.construction_year.grid(row=2, column=1, padx=5, pady=3)
-        self.construction_year.insert(0, "2000")
-        
-        # 2. OBÁLKA BUDOVY
-        envelope_frame = tk.LabelFrame(scrollable_frame, text="🏠 Obálka budovy", bg='white')
-        envelope_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        tk.Label(envelope_frame, text="Plocha stien [m²]:", bg='white').grid(row=0, column=0, sticky=tk.W, padx=5, pady=3)
-        self.wall_area = tk.Entry(envelope_frame, width=30)
-        self.wall_area.grid(row=0, column=1, padx=5, pady=3)
-        self.wall_area.insert(0, "150")
-        
-        tk.Label(envelope_frame, text="U-hodnota stien [W/m²K]:", bg='white').grid(row=1, column=0, sticky=tk.W, padx=5, pady=3)
-        self.wall_u = tk.Entry(envelope_frame, width=30)
-        self.wall_u.grid(row=1, column=1, padx=5, pady=3)
-        self.wall_u.insert(0, "0.25")
-        
-        tk.Label(envelope_frame, text="Plocha okien [m²]:", bg='white').grid(row=2, column=0, sticky=tk.W, padx=5, pady=3)
-        self.window_area = tk.Entry(envelope_frame, width=30)
-        self.window_area.grid(row=2, column=1, padx=5, pady=3)
-        self.window_area.insert(0, "25")
-        
-        tk.Label(envelope_frame, text="U-hodnota okien [W/m²K]:", bg='white').grid(row=3, column=0, sticky=tk.W, padx=5, pady=3)
-        self.window_u = tk.Entry(envelope_frame, width=30)
-        self.window_u.grid(row=3, column=1, padx=5, pady=3)
-        self.window_u.insert(0, "1.1")
-        
-        # 3. SYSTÉMY
-        systems_frame = tk.LabelFrame(scrollable_frame, text="⚙️ Systémy", bg='white')
-        systems_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        tk.Label(systems_frame, text="Typ vykurovania:", bg='white').grid(row=0, column=0, sticky=tk.W, padx=5, pady=3)
-        self.heating_type = ttk.Combobox(systems_frame, values=["Plynový kotol", "Elektrické", "Tepelné čerpadlo"])
-        self.heating_type.grid(row=0, column=1, padx=5, pady=3)
-        self.heating_type.set("Plynový kotol")
-        
-        tk.Label(systems_frame, text="Účinnosť vykurovania [%]:", bg='white').grid(row=1, column=0, sticky=tk.W, padx=5, pady=3)
-        self.heating_efficiency = tk.Entry(systems_frame, width=30)
-        self.heating_efficiency.grid(row=1, column=1, padx=5, pady=3)
-        self.heating_efficiency.insert(0, "90")
+        # Sekcie a polia podľa tabuľky _FORM_SECTIONS
+        self._entries = {}
+        for title, fields in _FORM_SECTIONS:
+            section_frame = tk.LabelFrame(scrollable_frame, text=title, bg='white')
+            section_frame.pack(fill=tk.X, padx=10, pady=5)
+            
+            for row, (key, label, default, *choices) in enumerate(fields):
+                ttk.Label(section_frame, text=label, style="Audit.TLabel").grid(row=row, column=0, sticky=tk.W, padx=5, pady=3)
+                if choices:
+                    widget = ttk.Combobox(section_frame, values=list(choices[0]))
+                    widget.set(default)
+                else:
+                    widget = ttk.Entry(section_frame, width=30, style="Audit.TEntry")
+                    widget.insert(0, default)
+                widget.grid(row=row, column=1, padx=5, pady=3)
+                self._entries[key] = widget
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -175,27 +510,25 @@ class SimpleEnergyAuditGUI:
                  font=('Arial', 10, 'bold'), width=12, height=2).pack(side=tk.RIGHT, padx=20)
         
     def collect_data(self):
-        """Zber údajov z formulára"""
+        """Zber údajov z formulára (typová kontrola a rozsah podľa _SCHEMA)"""
         try:
-            self.audit_data = {
-                'building': {
-                    'name': self.building_name.get() or "Test budova",
-                    'floor_area': float(self.floor_area.get() or 120),
-                    'construction_year': int(self.construction_year.get() or 2000)
-                },
-                'envelope': {
-                    'wall_area': float(self.wall_area.get() or 150),
-                    'wall_u': float(self.wall_u.get() or 0.25),
-                    'window_area': float(self.window_area.get() or 25),
-                    'window_u': float(self.window_u.get() or 1.1)
-                },
-                'systems': {
-                    'heating_type': self.heating_type.get() or "Plynový kotol",
-                    'heating_efficiency': float(self.heating_efficiency.get() or 90) / 100
-                }
-            }
+            audit_data = {'building': {}, 'envelope': {}, 'systems': {}}
+            for field, (section, key, caster, default, limits) in _SCHEMA.items():
+                raw = self._entries[field].get().strip()
+                try:
+                    value = caster(raw) if raw else default
+                except ValueError:
+                    raise ValueError(f"{field}: '{raw}' nie je platné číslo") from None
+                if limits and not limits[0] <= value <= limits[1]:
+                    raise ValueError(f"{field}: {value} mimo rozsahu {limits[0]}-{limits[1]}")
+                audit_data[section][key] = value
+            
+            # Účinnosť sa zadáva v %
+            audit_data['systems']['heating_efficiency'] /= 100
+            self.audit_data = audit_data
             return True
         except ValueError as e:
+            from tkinter import messagebox
             messagebox.showerror("Chyba", f"Neplatné údaje: {e}")
             return False
         
@@ -208,76 +541,28 @@ class SimpleEnergyAuditGUI:
             
         self.audit_button.config(text="⏳ PREBIEHA AUDIT...", state=tk.DISABLED)
         self.progress['value'] = 0
-        self.root.update()
+        
+        future = self._executor.submit(self._compute_results, self.audit_data)
+        self.root.after(50, self._poll_future, future, self.audit_data)
+        
+    def _poll_future(self, future, audit_data):
+        """Sledovanie výpočtu vo vlákne; výsledky sa spracujú v hlavnom vlákne"""
+        if not future.done():
+            self.progress['value'] = min(self.progress['value'] + 10, 90)
+            self.root.after(50, self._poll_future, future, audit_data)
+            return
+        
+        from tkinter import messagebox
         
         try:
-            # Simulácia výpočtu
-            self.progress['value'] = 25
-            self.root.update()
-            
-            # Základné výpočty
-            building = self.audit_data['building']
-            envelope = self.audit_data['envelope']
-            systems = self.audit_data['systems']
-            
-            # Tepelné straty
-            wall_losses = envelope['wall_area'] * envelope['wall_u']
-            window_losses = envelope['window_area'] * envelope['window_u'] 
-            total_losses = wall_losses + window_losses
-            
-            self.progress['value'] = 50
-            self.root.update()
-            
-            # Potreba tepla
-            hdd = 2800  # Bratislava
-            heating_need = total_losses * hdd * 24 / 1000  # kWh/rok
-            
-            # Spotreba energie
-            heating_energy = heating_need / systems['heating_efficiency']
-            electricity = building['floor_area'] * 15  # kWh/m²rok
-            total_energy = heating_energy + electricity
-            
-            self.progress['value'] = 75
-            self.root.update()
-            
-            # Primárna energia a trieda
-            primary_energy = heating_energy * 1.1 + electricity * 3.0
-            specific_primary = primary_energy / building['floor_area']
-            
-            # Určenie triedy
-            if specific_primary <= 50:
-                energy_class = 'A'
-            elif specific_primary <= 110:
-                energy_class = 'C'  
-            elif specific_primary <= 150:
-                energy_class = 'D'
-            elif specific_primary <= 200:
-                energy_class = 'E'
-            else:
-                energy_class = 'F'
-                
-            # CO2 emisie
-            co2_emissions = heating_energy * 0.202 + electricity * 0.486
-            specific_co2 = co2_emissions / building['floor_area']
-            
-            self.progress['value'] = 100
-            self.root.update()
-            
-            # Uloženie výsledkov
-            self.results = {
-                'total_energy': total_energy,
-                'heating_energy': heating_energy, 
-                'electricity': electricity,
-                'primary_energy': primary_energy,
-                'specific_primary': specific_primary,
-                'energy_class': energy_class,
-                'co2_emissions': co2_emissions,
-                'specific_co2': specific_co2,
-                'total_losses': total_losses
-            }
+            self.results = future.result()
+            self._results_data = audit_data
+            self._calc_details = None
             
-            # Zobrazenie výsledkov
+            # Zobrazenie výsledkov - jedno prekreslenie namiesto pumpovania udalostí po krokoch
             self.display_results()
+            self.progress['value'] = 100
+            self.root.update_idletasks()
             
             messagebox.showinfo("Úspech", "✅ Energetický audit dokončený!")
             
@@ -287,61 +572,46 @@ class SimpleEnergyAuditGUI:
             self.audit_button.config(text="🔬 VYKONAŤ ENERGETICKÝ AUDIT", state=tk.NORMAL)
             self.progress['value'] = 0
             
+    def _compute_results(self, audit_data):
+        """Výsledky auditu jednej budovy (zdieľajú ich výsledky aj detailné výpočty)"""
+        building = audit_data['building']
+        envelope = audit_data['envelope']
+        systems = audit_data['systems']
+        
+        # Polia dĺžky 1 - jedna budova
+        arrays = {
+            'floor_area': np.array([building['floor_area']]),
+            'wall_area': np.array([envelope['wall_area']]),
+            'wall_u': np.array([envelope['wall_u']]),
+            'window_area': np.array([envelope['window_area']]),
+            'window_u': np.array([envelope['window_u']]),
+            'heating_efficiency': np.array([systems['heating_efficiency']]),
+        }
+        values = {key: float(column[0]) for key, column in compute_audit(arrays).items()}
+        
+        # Určenie triedy
+        energy_class = _CLASSES[bisect.bisect_left(_CLASS_THRESHOLDS, values['specific_primary'])]
+        return AuditResults(energy_class=energy_class, **values)
+        
     def display_results(self):
         """Zobrazenie výsledkov"""
+        audit_data = self._results_data
+        recommendations = _recommendations(audit_data['envelope'], audit_data['systems'])
+        ctx = {
+            **audit_data['building'],
+            **dataclasses.asdict(self.results),
+            'sep': '=' * 50,
+            'recommendations': "\n".join(recommendations) if recommendations else "• Budova je v dobrom energetikom stave",
+        }
+        
+        # Jedno vloženie celého textu do widgetu
         self.results_text.delete(1.0, tk.END)
-        
-        building = self.audit_data['building']
-        results = self.results
-        
-        output = f"""
-{'='*50}
-📋 ENERGETICKÝ AUDIT - VÝSLEDKY
-{'='*50}
-
-🏢 BUDOVA: {building['name']}
-📐 Podlahová plocha: {building['floor_area']:.0f} m²
-📅 Rok výstavby: {building['construction_year']}
-
-⚡ ENERGETICKÁ BILANCIA:
-├─ Vykurovanie: {results['heating_energy']:.0f} kWh/rok
-├─ Elektrina: {results['electricity']:.0f} kWh/rok  
-└─ CELKOM: {results['total_energy']:.0f} kWh/rok
-
-🎯 ENERGETICKÉ HODNOTENIE:
-├─ Energetická trieda: {results['energy_class']}
-├─ Primárna energia: {results['specific_primary']:.1f} kWh/m²rok
-├─ CO2 emisie: {results['specific_co2']:.1f} kg/m²rok
-└─ Tepelné straty: {results['total_losses']:.1f} W/K
-
-💡 ODPORÚČANIA:
-"""
-        
-        # Generovanie odporúčaní
-        recommendations = []
-        envelope = self.audit_data['envelope']
-        
-        if envelope['wall_u'] > 0.30:
-            recommendations.append("• Zateplenie stien (úspory 25-35%)")
-        if envelope['window_u'] > 2.0:
-            recommendations.append("• Výmena okien (úspory 15-20%)")
-        if self.audit_data['systems']['heating_efficiency'] < 0.85:
-            recommendations.append("• Modernizácia vykurovania (úspory 20-30%)")
-        
-        if recommendations:
-            output += "\n".join(recommendations)
-        else:
-            output += "• Budova je v dobrom energetikom stave"
-            
-        output += f"\n\n📋 CERTIFIKÁCIA:\n"
-        output += f"🏅 Energetická trieda: {results['energy_class']}\n"
-        output += f"⚡ Primárna energia: {results['specific_primary']:.1f} kWh/m²rok\n"
-        output += f"🌍 CO2 emisie: {results['specific_co2']:.1f} kg CO2/m²rok\n"
-        
-        self.results_text.insert(tk.END, output)
+        self.results_text.insert(tk.END, _RESULTS_TEMPLATE.format_map(ctx))
         
     def save_project(self):
         """Uloženie projektu"""
+        from tkinter import messagebox
+        
         if not self.audit_data:
             messagebox.showwarning("Upozornenie", "Nie je čo uložiť.")
             return
@@ -349,26 +619,29 @@ class SimpleEnergyAuditGUI:
         
     def generate_certificate(self):
         """Generovanie certifikátu"""
+        from tkinter import messagebox
+        
         if not self.results:
             messagebox.showwarning("Upozornenie", "Najprv vykonajte audit.")
             return
             
         # Vytvorenie certifikátu
-        building = self.audit_data['building']
+        building = self._results_data['building']
         results = self.results
+        cert_number, issued, valid_until = _certificate_stamps()
         
         certificate_info = f"""
 🏅 ENERGETICKÝ CERTIFIKÁT
 
 Budova: {building['name']}
-Číslo certifikátu: EC-{datetime.now().strftime('%Y%m%d%H%M')}
+Číslo certifikátu: {cert_number}
 
-Energetická trieda: {results['energy_class']}
-Primárna energia: {results['specific_primary']:.1f} kWh/m²rok
-CO2 emisie: {results['specific_co2']:.1f} kg CO2/m²rok
+Energetická trieda: {results.energy_class}
+Primárna energia: {results.specific_primary:.1f} kWh/m²rok
+CO2 emisie: {results.specific_co2:.1f} kg CO2/m²rok
 
-Dátum vydania: {datetime.now().strftime('%d.%m.%Y')}
-Platnosť do: {datetime.now().replace(year=datetime.now().year + 10).strftime('%d.%m.%Y')}
+Dátum vydania: {issued}
+Platnosť do: {valid_until}
 """
         
         messagebox.showinfo("Certifikát", certificate_info)
@@ -376,14 +649,40 @@ Platnosť do: {datetime.now().replace(year=datetime.now().year + 10).strftime('%
     def show_calculation_details(self):
         """Zobrazenie detailných výpočtov s vzorcami"""
         if not self.audit_data or not self.results:
+            from tkinter import messagebox
             messagebox.showwarning("Upozornenie", "Najprv vykonajte audit pre zobrazenie výpočtov.")
             return
         
-        # Vytvorenie nového okna pre výpočty
+        # Okno sa vytvorí raz; pri ďalšom zobrazení sa len obnoví text
+        if self._calc_window is None or not self._calc_window.winfo_exists():
+            self._build_calc_window()
+        else:
+            self._calc_window.deiconify()
+            self._calc_window.lift()
+        
+        # Generovanie detailných výpočtov; text sa vkladá po častiach
+        self._calc_stream += 1
+        self._calc_text.config(state=tk.NORMAL)
+        self._calc_text.delete(1.0, tk.END)
+        self._stream_insert(self.generate_calculation_details(), 0, self._calc_stream)
+        
+    def _stream_insert(self, text, start, stream, chunk=1024):
+        """Vloženie ďalšej časti textu; medzi časťami beží slučka udalostí Tk"""
+        if stream != self._calc_stream or not self._calc_text.winfo_exists():
+            return  # medzitým sa začalo nové vkladanie alebo okno zaniklo
+        self._calc_text.insert(tk.END, text[start:start + chunk])
+        if start + chunk < len(text):
+            self._calc_text.after_idle(self._stream_insert, text, start + chunk, stream, chunk)
+        else:
+            self._calc_text.config(state=tk.DISABLED)
+        
+    def _build_calc_window(self):
+        """Vytvorenie okna pre výpočty (zatvorenie ho len skryje)"""
         calc_window = tk.Toplevel(self.root)
         calc_window.title("🧮 DETAILNÉ VÝPOČTY - ENERGETICKÝ AUDIT")
         calc_window.geometry("900x700")
         calc_window.configure(bg='white')
+        calc_window.protocol("WM_DELETE_WINDOW", calc_window.withdraw)
         
         # Header
         header = tk.Frame(calc_window, bg='#34495e', height=50)
@@ -393,237 +692,77 @@ Platnosť do: {datetime.now().replace(year=datetime.now().year + 10).strftime('%
         tk.Label(header, text="🧮 KROK-ZA-KROKOM VÝPOČTY", 
                 font=('Arial', 14, 'bold'), fg='white', bg='#34495e').pack(pady=10)
         
+        # Tlačidlo na zatvorenie (balí sa pred textom, aby zostalo viditeľné)
+        tk.Button(calc_window, text="❌ Zavrieť", command=calc_window.withdraw,
+                 bg='#e74c3c', fg='white', font=('Arial', 12, 'bold')).pack(side=tk.BOTTOM, pady=10)
+        
         # Scrollable text area
         text_frame = tk.Frame(calc_window)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        calc_text = scrolledtext.ScrolledText(text_frame, font=('Consolas', 10), 
-                                              bg='#f8f9fa', wrap=tk.WORD)
-        calc_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Generovanie detailných výpočtov
-        calculation_details = self.generate_calculation_details()
-        calc_text.insert(tk.END, calculation_details)
-        calc_text.config(state=tk.DISABLED)
-        
-        # Tlačidlo na zatvorenie
-        tk.Button(calc_window, text="❌ Zavrieť", command=calc_window.destroy,
-                 bg='#e74c3c', fg='white', font=('Arial', 12, 'bold')).pack(pady=10)
+        self._calc_text = scrolledtext.ScrolledText(text_frame, font=('Consolas', 10), 
+                                                    bg='#f8f9fa', wrap=tk.WORD)
+        self._calc_text.pack(fill=tk.BOTH, expand=True)
+        self._calc_window = calc_window
                  
     def generate_calculation_details(self):
         """Generovanie detailného opisu výpočtov s vzorcami"""
-        building = self.audit_data['building']
-        envelope = self.audit_data['envelope']
-        systems = self.audit_data['systems']
-        results = self.results
-        
-        # Výpočet hodnôt krok za krokom
-        wall_losses = envelope['wall_area'] * envelope['wall_u']
-        window_losses = envelope['window_area'] * envelope['window_u']
-        total_losses = wall_losses + window_losses
-        
-        hdd = 2800  # Bratislava
-        heating_need = total_losses * hdd * 24 / 1000
-        heating_energy = heating_need / systems['heating_efficiency']
-        electricity = building['floor_area'] * 15
-        total_energy = heating_energy + electricity
-        
-        primary_energy = heating_energy * 1.1 + electricity * 3.0
-        specific_primary = primary_energy / building['floor_area']
-        
-        co2_emissions = heating_energy * 0.202 + electricity * 0.486
-        specific_co2 = co2_emissions / building['floor_area']
-        
-        details = f"""
-{'='*80}
-🧮 DETAILNÉ VÝPOČTY ENERGETICKÉHO AUDITU
-{'='*80}
-
-📊 VSTUPNÉ ÚDAJE:
-{'─'*40}
-🏢 Budova: {building['name']}
-📐 Podlahová plocha (Af): {building['floor_area']:.1f} m²
-📅 Rok výstavby: {building['construction_year']}
-🧱 Plocha stien (Aw): {envelope['wall_area']:.1f} m²
-🧱 U-hodnota stien (Uw): {envelope['wall_u']:.3f} W/m²K
-🪟 Plocha okien (Aok): {envelope['window_area']:.1f} m²
-🪟 U-hodnota okien (Uok): {envelope['window_u']:.3f} W/m²K
-⚙️  Typ vykurovania: {systems['heating_type']}
-⚙️  Účinnosť vykurovania (ηh): {systems['heating_efficiency']*100:.1f}%
-
-{'='*80}
-📈 KROK 1: VÝPOČET TEPELNÝCH STRÁT
-{'='*80}
-
-📐 VZOREC: Tepelné straty = Súčet (Plocha × U-hodnota)
-
-🧱 Tepelné straty stenami:
-   Qw = Aw × Uw
-   Qw = {envelope['wall_area']:.1f} m² × {envelope['wall_u']:.3f} W/m²K
-   Qw = {wall_losses:.2f} W/K
-
-🪟 Tepelné straty oknami:
-   Qok = Aok × Uok
-   Qok = {envelope['window_area']:.1f} m² × {envelope['window_u']:.3f} W/m²K
-   Qok = {window_losses:.2f} W/K
-
-📊 CELKOVÉ TEPELNÉ STRATY:
-   Qtotal = Qw + Qok
-   Qtotal = {wall_losses:.2f} + {window_losses:.2f}
-   Qtotal = {total_losses:.2f} W/K
-
-{'='*80}
-📈 KROK 2: POTREBA TEPLA NA VYKUROVANIE
-{'='*80}
-
-📐 VZOREC: Qh = Qtotal × HDD × 24 / 1000
-   kde: HDD = Heating Degree Days (stupňové dni vykurovania)
-
-🌡️  Heating Degree Days (Bratislava): {hdd} K·deň/rok
-
-🔥 Potreba tepla na vykurovanie:
-   Qh = {total_losses:.2f} W/K × {hdd} K·deň/rok × 24 h/deň ÷ 1000
-   Qh = {heating_need:.0f} kWh/rok
-
-{'='*80}
-📈 KROK 3: SPOTREBA ENERGIE NA VYKUROVANIE
-{'='*80}
-
-📐 VZOREC: Eh = Qh / ηh
-   kde: ηh = účinnosť vykurovacieho systému
-
-⚙️  Spotreba energie na vykurovanie:
-   Eh = {heating_need:.0f} kWh/rok ÷ {systems['heating_efficiency']:.2f}
-   Eh = {heating_energy:.0f} kWh/rok
-
-{'='*80}
-📈 KROK 4: SPOTREBA ELEKTRICKEJ ENERGIE
-{'='*80}
-
-📐 VZOREC: Eel = Af × 15 kWh/m²rok (štandardná hodnota)
-
-💡 Spotreba elektrickej energie:
-   Eel = {building['floor_area']:.1f} m² × 15 kWh/m²rok
-   Eel = {electricity:.0f} kWh/rok
-
-{'='*80}
-📈 KROK 5: CELKOVÁ SPOTREBA ENERGIE
-{'='*80}
-
-📐 VZOREC: Etotal = Eh + Eel
-
-⚡ Celková spotreba energie:
-   Etotal = {heating_energy:.0f} + {electricity:.0f}
-   Etotal = {total_energy:.0f} kWh/rok
-
-{'='*80}
-📈 KROK 6: PRIMÁRNA ENERGIA
+        from datetime import datetime
+        
+        # Vstupy, z ktorých vznikli self.results (formulár sa medzitým mohol zmeniť)
+        audit_data = self._results_data
+        building = audit_data['building']
+        envelope = audit_data['envelope']
+        systems = audit_data['systems']
+        key = (building['name'], building['floor_area'], building['construction_year'],
+               envelope['wall_area'], envelope['wall_u'], envelope['window_area'], envelope['window_u'],
+               systems['heating_type'], systems['heating_efficiency'])
+        
+        # Jedna položka (kľúč, výsledky, text) - vyprázdni sa pri nových výsledkoch
+        cached = self._calc_details
+        if cached is None or cached[0] != key or cached[1] is not self.results:
+            cached = (key, self.results, _calc_details_text(audit_data, self.results))
+            self._calc_details = cached
+        
+        # Časová pečiatka sa dopĺňa mimo cache
+        return cached[2] + f"""
 {'='*80}
-
-📐 VZOREC: Ep = Eh × fp,h + Eel × fp,el
-   kde: fp,h = faktor primárnej energie pre vykurovanie
-        fp,el = faktor primárnej energie pre elektrinu
-
-🔢 Faktory primárnej energie:
-   - Vykurovanie (plyn): fp,h = 1.1
-   - Elektrina: fp,el = 3.0
-
-🎯 Primárna energia:
-   Ep = {heating_energy:.0f} × 1.1 + {electricity:.0f} × 3.0
-   Ep = {heating_energy * 1.1:.0f} + {electricity * 3.0:.0f}
-   Ep = {primary_energy:.0f} kWh/rok
-
-📊 Špecifická primárna energia:
-   ep = Ep / Af
-   ep = {primary_energy:.0f} kWh/rok ÷ {building['floor_area']:.1f} m²
-   ep = {specific_primary:.1f} kWh/m²rok
-
-{'='*80}
-📈 KROK 7: ENERGETICKÁ TRIEDA
-{'='*80}
-
-📐 KLASIFIKÁCIA PODĽA STN EN 16247:
-   A: ≤ 50 kWh/m²rok    (Veľmi úsporná)
-   B: ≤ 75 kWh/m²rok    (Úsporná)
-   C: ≤ 110 kWh/m²rok   (Vyhovujúca)
-   D: ≤ 150 kWh/m²rok   (Nevyhovujúca)
-   E: ≤ 200 kWh/m²rok   (Neúsporná)
-   F: ≤ 250 kWh/m²rok   (Veľmi neúsporná)
-   G: > 250 kWh/m²rok   (Mimoriadne neúsporná)
-
-🏅 HODNOTENIE:
-   Špecifická primárna energia: {specific_primary:.1f} kWh/m²rok
-   Energetická trieda: {results['energy_class']}
-
-{'='*80}
-📈 KROK 8: CO2 EMISIE
-{'='*80}
-
-📐 VZOREC: CO2 = Eh × fCO2,h + Eel × fCO2,el
-   kde: fCO2,h = emisný faktor pre vykurovanie
-        fCO2,el = emisný faktor pre elektrinu
-
-🌍 Emisné faktory:
-   - Vykurovanie (plyn): fCO2,h = 0.202 kg CO2/kWh
-   - Elektrina: fCO2,el = 0.486 kg CO2/kWh
-
-🌱 CO2 emisie:
-   CO2 = {heating_energy:.0f} × 0.202 + {electricity:.0f} × 0.486
-   CO2 = {heating_energy * 0.202:.0f} + {electricity * 0.486:.0f}
-   CO2 = {co2_emissions:.0f} kg CO2/rok
-
-📊 Špecifické CO2 emisie:
-   co2 = CO2 / Af
-   co2 = {co2_emissions:.0f} kg CO2/rok ÷ {building['floor_area']:.1f} m²
-   co2 = {specific_co2:.1f} kg CO2/m²rok
-
-{'='*80}
-📋 SÚHRN VÝSLEDKOV
-{'='*80}
-
-🏢 BUDOVA: {building['name']}
-📐 Podlahová plocha: {building['floor_area']:.0f} m²
-
-⚡ ENERGETICKÁ BILANCIA:
-├─ Potreba tepla: {heating_need:.0f} kWh/rok
-├─ Spotreba na vykurovanie: {heating_energy:.0f} kWh/rok
-├─ Spotreba elektrickej energie: {electricity:.0f} kWh/rok
-└─ CELKOVÁ SPOTREBA: {total_energy:.0f} kWh/rok
-
-🎯 ENERGETICKÉ HODNOTENIE:
-├─ Primárna energia: {primary_energy:.0f} kWh/rok
-├─ Špecifická primárna energia: {specific_primary:.1f} kWh/m²rok
-├─ Energetická trieda: {results['energy_class']}
-└─ Tepelné straty: {total_losses:.2f} W/K
-
-🌍 ENVIRONMENTÁLNY DOPAD:
-├─ CO2 emisie: {co2_emissions:.0f} kg CO2/rok
-└─ Špecifické CO2 emisie: {specific_co2:.1f} kg CO2/m²rok
-
-{'='*80}
-📚 POUŽITÉ NORMY A ŠTANDARDY:
+Koniec detailného výpočtu - {datetime.now().strftime('%d.%m.%Y %H:%M')}
 {'='*80}
+"""
 
-• STN EN 16247-1: Energetické audity - Časť 1: Všeobecné požiadavky
-• STN EN ISO 13790: Energetická náročnosť budov
-• Vyhláška MH SR č. 364/2012 Z. z. o energetickej náročnosti budov
-• STN 73 0540: Tepelná ochrana budov
 
-📖 POZNÁMKY:
-• HDD hodnota 2800 K·deň/rok je typická pre Bratislavu
-• Faktory primárnej energie sú v súlade s platnou legislatívou SR
-• Emisné faktory zodpovedajú aktuálnym hodnotám pre SR
-• Štandardná spotreba elektrickej energie 15 kWh/m²rok pre obytné budovy
+def _calc_details_text(audit_data, results):
+    """Text detailných výpočtov pre vstupy auditu a ich výsledky (AuditResults)"""
+    systems = audit_data['systems']
+    # Jedna úroveň kľúčov - šablóna nerobí vnorené vyhľadávanie
+    ctx = {
+        **audit_data['building'],
+        **audit_data['envelope'],
+        **systems,
+        # Medzivýsledky z perform_audit (bez opakovaného výpočtu)
+        **dataclasses.asdict(results),
+        'rule': '=' * 80,
+        'thin': '─' * 40,
+        'hdd': _HDD,
+        'eff_pct': systems['heating_efficiency'] * 100,
+        'ep_heat': results.heating_energy * audit_kernel.PRIMARY_FACTOR_HEATING,
+        'ep_el': results.electricity * audit_kernel.PRIMARY_FACTOR_ELECTRICITY,
+        'co2_heat': results.heating_energy * audit_kernel.CO2_FACTOR_HEATING,
+        'co2_el': results.electricity * audit_kernel.CO2_FACTOR_ELECTRICITY,
+        # Faktory v texte sú tie isté konštanty, s ktorými počíta jadro
+        'fp_h': audit_kernel.PRIMARY_FACTOR_HEATING,
+        'fp_el': audit_kernel.PRIMARY_FACTOR_ELECTRICITY,
+        'fco2_h': audit_kernel.CO2_FACTOR_HEATING,
+        'fco2_el': audit_kernel.CO2_FACTOR_ELECTRICITY,
+        'el_m2': audit_kernel.ELECTRICITY_PER_M2,
+    }
+    return _CALC_DETAILS_TEMPLATE.format_map(ctx)
 
-{'='*80}
-Koniec detailného výpočtu - {datetime.now().strftime('%d.%m.%Y %H:%M')}
-{'='*80}
-"""
-        
-        return details
 
 def main():
     """Spustenie aplikácie"""
+    _import_tk()
     root = tk.Tk()
     app = SimpleEnergyAuditGUI(root)
     root.mainloop()
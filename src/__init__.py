@@ -9,7 +9,14 @@ __author__ = "Energy Audit Team"
 __email__ = "team@energyaudit.local"
 
 from .main import EnergyAuditApp, main
-from .config import *
+from .config import (
+    APP_NAME,
+    APP_VERSION,
+    ENERGY_CONSTANTS,
+    ENERGY_CLASSES,
+    BUILDING_TYPES,
+    HEATING_TYPES,
+)
 
 __all__ = [
     "EnergyAuditApp",
@@ -3,13 +3,19 @@ Pokročilé reporty a analýzy pre energetický audit
 Implementuje detailné správy s grafmi, porovnaniami a odporúčaniami na optimalizáciu
 """
 
+import copy
+import hashlib
 import json
 import math
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import statistics
+from collections import OrderedDict
+
+import numpy as np
 
 try:
     from .config import ENERGY_CLASSES, BUILDING_TYPES, HEATING_TYPES
@@ -73,7 +79,7 @@ class ImprovementRecommendation:
             self.payback_period = self.estimated_cost / self.estimated_savings_annual
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnergyBalance:
     """Energetická bilancia budovy"""
     heating_demand: float  # kWh/rok
@@ -100,9 +106,16 @@ class EnergyBalance:
         return min(100.0, (self.renewable_generation / self.total_demand) * 100)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkData:
     """Porovnacie údaje (benchmark)"""
+    # __slots__ ručne - dataclass(slots=True) vyžaduje Python 3.10
+    __slots__ = (
+        'building_type', 'typical_heating_demand', 'typical_hot_water_demand',
+        'typical_primary_energy', 'typical_co2_emissions', 'best_practice_heating',
+        'best_practice_primary_energy', 'passive_house_standard',
+    )
+    
     building_type: str
     typical_heating_demand: float  # kWh/m²rok
     typical_hot_water_demand: float  # kWh/m²rok
@@ -113,6 +126,34 @@ class BenchmarkData:
     passive_house_standard: float  # kWh/m²rok
 
 
+# Porovnacie údaje pre rôzne typy budov (nemenné, zdieľané všetkými inštanciami)
+_BENCHMARKS = MappingProxyType({
+    "Rodinný dom": BenchmarkData(
+        "Rodinný dom", 80.0, 15.0, 150.0, 35.0, 40.0, 80.0, 15.0
+    ),
+    "Bytový dom": BenchmarkData(
+        "Bytový dom", 70.0, 12.0, 130.0, 30.0, 35.0, 70.0, 15.0
+    ),
+    "Administratívna budova": BenchmarkData(
+        "Administratívna budova", 60.0, 5.0, 120.0, 28.0, 30.0, 60.0, 15.0
+    ),
+    "Škola": BenchmarkData(
+        "Škola", 65.0, 8.0, 125.0, 30.0, 32.0, 65.0, 15.0
+    )
+})
+
+
+# Hranice U-hodnôt [W/m²K] pre hodnotenie konštrukcií podľa typu
+_U_VALUE_RATING_BINS = {
+    'wall': np.array([0.20, 0.32, 0.46]),
+    'roof': np.array([0.15, 0.20, 0.32]),
+}
+_U_VALUE_RATINGS = np.array(["Vynikajúca", "Dobrá", "Vyhovujúca", "Nevyhovujúca"], dtype=object)
+
+# Počet správ v cache generátora (najdlhšie nepoužitá vypadne)
+_REPORT_CACHE_SIZE = 8
+
+
 class AdvancedReportGenerator:
     """Generátor pokročilých správ"""
     
@@ -125,24 +166,10 @@ class AdvancedReportGenerator:
         self.construction_assessor = get_construction_assessor()
         
         # Načítanie porovnacích údajov
-        self.benchmarks = self._load_benchmarks()
-    
-    def _load_benchmarks(self) -> Dict[str, BenchmarkData]:
-        """Načítanie porovnacích údajov pre rôzne typy budov"""
-        return {
-            "Rodinný dom": BenchmarkData(
-                "Rodinný dom", 80.0, 15.0, 150.0, 35.0, 40.0, 80.0, 15.0
-            ),
-            "Bytový dom": BenchmarkData(
-                "Bytový dom", 70.0, 12.0, 130.0, 30.0, 35.0, 70.0, 15.0
-            ),
-            "Administratívna budova": BenchmarkData(
-                "Administratívna budova", 60.0, 5.0, 120.0, 28.0, 30.0, 60.0, 15.0
-            ),
-            "Škola": BenchmarkData(
-                "Škola", 65.0, 8.0, 125.0, 30.0, 32.0, 65.0, 15.0
-            )
-        }
+        self.benchmarks = _BENCHMARKS
+        
+        # LRU cache správ: audit_id -> (odtlačok údajov auditu a konštrukcií, správa)
+        self._report_cache: "OrderedDict[int, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
     
     def generate_comprehensive_report(self, audit_id: int) -> Dict[str, Any]:
         """
@@ -157,17 +184,57 @@ class AdvancedReportGenerator:
         # Načítanie údajov auditu
         audit_data = self.db_manager.get_audit(audit_id)
         if not audit_data:
+            self.invalidate(audit_id)
             raise ValueError(f"Audit s ID {audit_id} neexistuje")
         
+        # Nezmenený audit aj konštrukcie (vrátane modified_date) -> správa z cache
+        structures = self.db_manager.get_building_structures(audit_id)
+        digest = self._report_digest(audit_data, structures)
+        cache = self._report_cache
+        cached = cache.get(audit_id)
+        if cached is None or cached[0] != digest:
+            cached = (digest, self._build_comprehensive_report(audit_id, audit_data, structures))
+            cache[audit_id] = cached
+            if len(cache) > _REPORT_CACHE_SIZE:
+                cache.popitem(last=False)
+        cache.move_to_end(audit_id)
+        
+        # Kópia, aby úprava správy volajúcim nezmenila cache; identifikátor
+        # a čas vygenerovania sa dopĺňajú mimo cache pri každom volaní
+        report = copy.deepcopy(cached[1])
+        now = datetime.now()
+        report["report_metadata"] = {
+            "report_id": f"ADV-{audit_id}-{now.strftime('%Y%m%d_%H%M%S')}",
+            "generated_date": now.isoformat(),
+            **report["report_metadata"]
+        }
+        return report
+    
+    def invalidate(self, audit_id: Optional[int] = None):
+        """Zahodenie uloženej správy auditu (bez audit_id všetkých správ)"""
+        if audit_id is None:
+            self._report_cache.clear()
+        else:
+            self._report_cache.pop(audit_id, None)
+    
+    @staticmethod
+    def _report_digest(audit_data: Dict[str, Any], structures: List[Dict[str, Any]]) -> bytes:
+        """Odtlačok vstupov správy"""
+        payload = json.dumps([audit_data, structures], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    def _build_comprehensive_report(self, audit_id: int, audit_data: Dict[str, Any],
+                                    structures: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Výpočet komplexnej správy z údajov auditu (bez report_id a generated_date)"""
         # Základné energetické výpočty
-        building_data = self._prepare_building_data_for_calculation(audit_id, audit_data)
+        building_data = self._prepare_building_data_for_calculation(audit_data, structures)
         energy_results = self.energy_calculator.complete_building_assessment(building_data)
         
         # Porovnanie s benchmarkom
         benchmark_analysis = self._analyze_benchmark_performance(audit_data, energy_results)
         
         # Analýza konštrukcií
-        construction_analysis = self._analyze_constructions(audit_id)
+        construction_analysis = self._analyze_constructions(structures)
         
         # Odporúčania na zlepšenie
         improvement_recommendations = self._generate_improvement_recommendations(
@@ -185,8 +252,6 @@ class AdvancedReportGenerator:
         
         report = {
             "report_metadata": {
-                "report_id": f"ADV-{audit_id}-{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "generated_date": datetime.now().isoformat(),
                 "report_type": ReportType.DETAILED_ANALYSIS.value,
                 "audit_id": audit_id,
                 "audit_name": audit_data.get('audit_name', 'Bez názvu')
@@ -222,7 +287,8 @@ class AdvancedReportGenerator:
         
         return report
     
-    def _prepare_building_data_for_calculation(self, audit_id: int, audit_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_building_data_for_calculation(self, audit_data: Dict[str, Any],
+                                               structures: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Príprava údajov budovy pre výpočet"""
         building_data = {
             'heated_area': audit_data.get('heated_area', 100),
@@ -231,8 +297,7 @@ class AdvancedReportGenerator:
             'heating_system': {}
         }
         
-        # Načítanie stavebných konštrukcií z databázy
-        structures = self.db_manager.get_building_structures(audit_id)
+        # Stavebné konštrukcie z databázy
         for struct in structures:
             building_data['structures'].append({
                 'name': struct.get('name', ''),
@@ -334,57 +399,41 @@ class AdvancedReportGenerator:
             "overall": int((heating_percentile + primary_percentile) / 2)
         }
     
-    def _analyze_constructions(self, audit_id: int) -> Dict[str, Any]:
-        """Analýza stavebných konštrukcií"""
+    def _analyze_constructions(self, structures: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analýza stavebných konštrukcií (načítaných z databázy)"""
         try:
-            # Získanie konštrukcií z databázy
-            structures = self.db_manager.get_building_structures(audit_id)
-            
             if not structures:
                 return {"warning": "Žiadne stavebné konštrukcie nie sú definované"}
             
-            construction_assessments = []
+            count = len(structures)
+            u_values = np.fromiter((s.get('u_value', 1.0) for s in structures), dtype=np.float64, count=count)
+            areas = np.fromiter((s.get('area', 0) for s in structures), dtype=np.float64, count=count)
+            heat_loss = u_values * areas
+            
+            # Hodnotenie U-hodnoty podľa typu konštrukcie (hranica patrí ešte do lepšej kategórie);
+            # okná, podlahy atď. vyžadujú detailnú analýzu
+            types = np.array([s.get('structure_type', 'wall') for s in structures])
+            ratings = np.full(count, "Vyžaduje detailnú analýzu", dtype=object)
+            for structure_type, bins in _U_VALUE_RATING_BINS.items():
+                mask = types == structure_type
+                ratings[mask] = _U_VALUE_RATINGS[np.digitize(u_values[mask], bins, right=True)]
             
-            for struct_data in structures:
-                # Pre jednoduchosť vytvoríme základnú analýzu U-hodnôt
-                u_value = struct_data.get('u_value', 1.0)
-                area = struct_data.get('area', 0)
-                structure_type = struct_data.get('structure_type', 'wall')
-                
-                # Hodnotenie U-hodnoty podľa typu konštrukcie
-                if structure_type == 'wall':
-                    if u_value <= 0.20:
-                        rating = "Vynikajúca"
-                    elif u_value <= 0.32:
-                        rating = "Dobrá"
-                    elif u_value <= 0.46:
-                        rating = "Vyhovujúca"
-                    else:
-                        rating = "Nevyhovujúca"
-                elif structure_type == 'roof':
-                    if u_value <= 0.15:
-                        rating = "Vynikajúca"
-                    elif u_value <= 0.20:
-                        rating = "Dobrá"
-                    elif u_value <= 0.32:
-                        rating = "Vyhovujúca"
-                    else:
-                        rating = "Nevyhovujúca"
-                else:  # okná, podlahy, atď.
-                    rating = "Vyžaduje detailnú analýzu"
-                
-                construction_assessments.append({
+            construction_assessments = [
+                {
                     'name': struct_data.get('name', 'Bez názvu'),
-                    'type': structure_type,
-                    'area': area,
-                    'u_value': u_value,
+                    'type': struct_data.get('structure_type', 'wall'),
+                    'area': struct_data.get('area', 0),
+                    'u_value': struct_data.get('u_value', 1.0),
                     'rating': rating,
-                    'heat_loss_coefficient': u_value * area
-                })
+                    'heat_loss_coefficient': loss
+                }
+                for struct_data, rating, loss in zip(structures, ratings.tolist(), heat_loss.tolist())
+            ]
             
             # Celková analýza
-            total_heat_loss = sum(assessment['heat_loss_coefficient'] for assessment in construction_assessments)
-            avg_u_value = sum(assessment['u_value'] * assessment['area'] for assessment in construction_assessments) / sum(assessment['area'] for assessment in construction_assessments) if construction_assessments else 0
+            total_area = areas.sum()
+            total_heat_loss = float(heat_loss.sum())
+            avg_u_value = float(np.dot(u_values, areas) / total_area) if total_area else 0
             
             return {
                 "individual_assessments": construction_assessments,
@@ -0,0 +1,71 @@
+"""
+Numerické jadro zjednodušeného energetického auditu
+Rovnaký kód počíta jednu budovu aj dávku budov (NumPy polia)
+"""
+
+import numpy as np
+
+# Numba je voliteľná - bez nej sa jadro vykoná v čistom Pythone / NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Náhrada za numba.njit, ktorá funkciu ponechá bez zmeny"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Stupňové dni vykurovania (Bratislava) a merná spotreba elektriny [kWh/m²rok]
+HDD = 2800.0
+ELECTRICITY_PER_M2 = 15.0
+
+# Faktory primárnej energie a emisné faktory [kg CO2/kWh] (vykurovanie plynom, elektrina)
+PRIMARY_FACTOR_HEATING = 1.1
+PRIMARY_FACTOR_ELECTRICITY = 3.0
+CO2_FACTOR_HEATING = 0.202
+CO2_FACTOR_ELECTRICITY = 0.486
+
+
+# Matica faktorov: riadky = primárna energia, CO2; stĺpce = vykurovanie, elektrina
+ENERGY_FACTORS = np.array([
+    [PRIMARY_FACTOR_HEATING, PRIMARY_FACTOR_ELECTRICITY],
+    [CO2_FACTOR_HEATING, CO2_FACTOR_ELECTRICITY],
+])
+
+
+@njit(cache=True)
+def _energy_kernel(wall_a, wall_u, win_a, win_u, floor_a, eta, hdd):
+    """Tepelné straty a spotreba energie (po prvkoch)"""
+    # Tepelné straty [W/K]
+    wall_losses = wall_a * wall_u
+    window_losses = win_a * win_u
+    total_losses = wall_losses + window_losses
+
+    # Potreba tepla a spotreba energie [kWh/rok]
+    heating_need = total_losses * hdd * 24.0 / 1000.0
+    heating_energy = heating_need / eta
+    electricity = floor_a * ELECTRICITY_PER_M2
+    return (wall_losses, window_losses, total_losses, heating_need, heating_energy,
+            electricity, heating_energy + electricity)
+
+
+def compute(wall_a, wall_u, win_a, win_u, floor_a, eta, hdd=HDD):
+    """
+    Energetická bilancia budovy (alebo po prvkoch pre polia)
+
+    Returns:
+        (wall_losses, window_losses, total_losses, heating_need, heating_energy,
+         electricity, total_energy, primary_energy, specific_primary,
+         co2_emissions, specific_co2)
+    """
+    energy = _energy_kernel(wall_a, wall_u, win_a, win_u, floor_a, eta, hdd)
+    heating_energy, electricity = energy[4], energy[5]
+
+    # Primárna energia a CO2 emisie jedným násobením maticou faktorov
+    primary_energy, co2_emissions = ENERGY_FACTORS @ np.stack((heating_energy, electricity))
+
+    return energy + (primary_energy, primary_energy / floor_a,
+                     co2_emissions, co2_emissions / floor_a)
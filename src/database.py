@@ -15,6 +15,9 @@ try:
 except ImportError:
     from config import DATABASE_PATH, ensure_directories
 
+# Klauzula RETURNING je v SQLite dostupná od verzie 3.35
+SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class DatabaseManager:
     """Správca databázy pre energetický audit"""
@@ -24,14 +27,25 @@ class DatabaseManager:
         Inicializácia databázového manažéra
         
         Args:
-            db_path: Cesta k databáze (použije sa predvolená ak nie je špecifikovaná)
+            db_path: Cesta k databáze (použije sa predvolená ak nie je špecifikovaná),
+                     alebo ":memory:" pre databázu v pamäti (napr. testy)
         """
         self.db_path = db_path or DATABASE_PATH
-        ensure_directories()
+        
+        # Databáza v pamäti existuje len v rámci jedného pripojenia, preto sa zdieľa
+        self._memory_conn = None
+        if str(self.db_path) == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:")
+            self._memory_conn.row_factory = sqlite3.Row
+        else:
+            ensure_directories()
         self.init_database()
     
     def get_connection(self) -> sqlite3.Connection:
         """Vytvorenie nového pripojenia k databáze"""
+        if self._memory_conn is not None:
+            return self._memory_conn
+        
         conn = sqlite3.Connection(str(self.db_path))
         conn.row_factory = sqlite3.Row  # Umožňuje pristup k stĺpcom podľa názvu
         return conn
@@ -177,38 +191,67 @@ class DatabaseManager:
             
         logging.info(f"Databáza inicializovaná: {self.db_path}")
     
-    def create_audit(self, audit_data: Dict[str, Any]) -> int:
+    def _execute_returning(self, cursor: sqlite3.Cursor, sql: str, params: List[Any],
+                           audit_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Vykonanie INSERT/UPDATE nad audits a vrátenie dotknutého riadku"""
+        if SQLITE_RETURNING:
+            row = cursor.execute(sql + " RETURNING *", params).fetchone()
+        else:
+            cursor.execute(sql, params)
+            row_id = cursor.lastrowid if audit_id is None else audit_id
+            row = cursor.execute("SELECT * FROM audits WHERE id = ?", (row_id,)).fetchone()
+        return dict(row) if row else None
+    
+    def _insert_audit(self, cursor: sqlite3.Cursor, audit_data: Dict[str, Any],
+                      return_row: bool = False):
+        """INSERT auditu s časovými údajmi; vráti (ID, riadok alebo None)"""
+        now = datetime.now().isoformat()
+        audit_data.update({
+            'created_date': now,
+            'modified_date': now
+        })
+        
+        columns = ', '.join(audit_data.keys())
+        placeholders = ', '.join(['?' for _ in audit_data])
+        sql = f"INSERT INTO audits ({columns}) VALUES ({placeholders})"
+        
+        if return_row:
+            row = self._execute_returning(cursor, sql, list(audit_data.values()))
+            return row['id'], row
+        cursor.execute(sql, list(audit_data.values()))
+        return cursor.lastrowid, None
+    
+    def _update_audit(self, cursor: sqlite3.Cursor, audit_id: int, audit_data: Dict[str, Any],
+                      return_row: bool = False):
+        """UPDATE auditu s časom zmeny; vráti riadok (return_row=True) alebo počet zmenených riadkov"""
+        audit_data['modified_date'] = datetime.now().isoformat()
+        
+        columns = ', '.join([f"{key} = ?" for key in audit_data.keys()])
+        values = list(audit_data.values()) + [audit_id]
+        sql = f"UPDATE audits SET {columns} WHERE id = ?"
+        
+        if return_row:
+            return self._execute_returning(cursor, sql, values, audit_id)
+        cursor.execute(sql, values)
+        return cursor.rowcount
+    
+    def create_audit(self, audit_data: Dict[str, Any], return_row: bool = False):
         """
         Vytvorenie nového auditu
         
         Args:
             audit_data: Slovník s údajmi o audite
+            return_row: Vrátiť celý vytvorený riadok namiesto ID
             
         Returns:
-            ID nového auditu
+            ID nového auditu (alebo vytvorený riadok pri return_row=True)
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            now = datetime.now().isoformat()
-            audit_data.update({
-                'created_date': now,
-                'modified_date': now
-            })
-            
-            columns = ', '.join(audit_data.keys())
-            placeholders = ', '.join(['?' for _ in audit_data])
-            
-            cursor.execute(
-                f"INSERT INTO audits ({columns}) VALUES ({placeholders})",
-                list(audit_data.values())
-            )
-            
-            audit_id = cursor.lastrowid
+            audit_id, row = self._insert_audit(conn.cursor(), audit_data, return_row)
             conn.commit()
             
         logging.info(f"Vytvorený nový audit s ID: {audit_id}")
-        return audit_id
+        return row if return_row else audit_id
     
     def get_audit(self, audit_id: int) -> Optional[Dict[str, Any]]:
         """Načítanie auditu podľa ID"""
@@ -233,25 +276,35 @@ class DatabaseManager:
             """)
             return [dict(row) for row in cursor.fetchall()]
     
-    def update_audit(self, audit_id: int, audit_data: Dict[str, Any]) -> bool:
-        """Aktualizácia existujúceho auditu"""
+    def update_audit(self, audit_id: int, audit_data: Dict[str, Any], return_row: bool = False):
+        """Aktualizácia existujúceho auditu (pri return_row=True vráti aktualizovaný riadok alebo None)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            audit_data['modified_date'] = datetime.now().isoformat()
-            
-            columns = ', '.join([f"{key} = ?" for key in audit_data.keys()])
-            values = list(audit_data.values()) + [audit_id]
+            result = self._update_audit(conn.cursor(), audit_id, audit_data, return_row)
+            conn.commit()
             
-            cursor.execute(
-                f"UPDATE audits SET {columns} WHERE id = ?",
-                values
-            )
+        return result if return_row else result > 0
+    
+    def create_and_update_audit(self, audit_data: Dict[str, Any], update_data: Dict[str, Any],
+                                return_row: bool = False):
+        """
+        Vytvorenie auditu a jeho aktualizácia v jednej transakcii
+        
+        Args:
+            audit_data: Slovník s údajmi o novom audite
+            update_data: Údaje, ktoré sa hneď po vytvorení zapíšu do auditu
+            return_row: Vrátiť výsledný riadok namiesto ID
             
-            affected_rows = cursor.rowcount
+        Returns:
+            ID nového auditu (alebo výsledný riadok pri return_row=True)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            audit_id, _ = self._insert_audit(cursor, audit_data)
+            row = self._update_audit(cursor, audit_id, update_data, return_row)
             conn.commit()
             
-        return affected_rows > 0
+        logging.info(f"Vytvorený nový audit s ID: {audit_id}")
+        return row if return_row else audit_id
     
     def delete_audit(self, audit_id: int) -> bool:
         """Vymazanie auditu a všetkých súvisiacich údajov"""
@@ -355,7 +408,10 @@ class DatabaseManager:
             latest_audit = cursor.fetchone()
             
             # Veľkosť databázového súboru
-            db_size = os.path.getsize(self.db_path) if self.db_path.exists() else 0
+            if self._memory_conn is not None:
+                db_size = 0
+            else:
+                db_size = os.path.getsize(self.db_path) if self.db_path.exists() else 0
             
             return {
                 'database_path': str(self.db_path),
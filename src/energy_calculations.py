@@ -3,9 +3,13 @@ Engine pre energetické výpočty a hodnotenie budov
 Obsahuje algoritmy pre výpočet tepelných strát, energetickej spotreby a klasifikácie
 """
 
+import copy
+import functools
+import json
 import math
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 
 try:
@@ -14,6 +18,36 @@ except ImportError:
     from config import ENERGY_CONSTANTS, ENERGY_CLASSES
 
 
+# Počet kompletných hodnotení v cache kalkulátora (najstaršie položky vypadnú)
+_ASSESSMENT_CACHE_SIZE = 32
+
+
+def _classify(energy_classes: Dict[str, Dict[str, Any]], specific_primary_energy: float) -> Dict[str, Any]:
+    """Zaradenie špecifickej primárnej energie do energetickej triedy"""
+    energy_class = "G"  # Predvolená najhoršia trieda
+    
+    for class_name, class_data in energy_classes.items():
+        if specific_primary_energy <= class_data["max_consumption"]:
+            energy_class = class_name
+            break
+    
+    class_info = energy_classes[energy_class]
+    
+    return {
+        'energy_class': energy_class,
+        'specific_primary_energy': specific_primary_energy,
+        'class_description': class_info['description'],
+        'class_color': class_info['color'],
+        'max_consumption_for_class': class_info['max_consumption']
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_default(specific_primary_energy: float) -> Dict[str, Any]:
+    """Klasifikácia podľa ENERGY_CLASSES s cache podľa hodnoty primárnej energie"""
+    return _classify(ENERGY_CLASSES, specific_primary_energy)
+
+
 class SeasonType(Enum):
     """Typy sezón pre výpočty"""
     HEATING = "heating"
@@ -69,6 +103,8 @@ class EnergyCalculator:
         self.internal_temp_heating = 20.0  # °C
         self.internal_temp_cooling = 24.0  # °C
         self.climate_data = ClimateData()
+        # Cache hodnotení: kanonický JSON (vstup + nastavenia kalkulátora) -> výsledok
+        self._assessment_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def calculate_transmission_losses(self, structures: List[BuildingStructure]) -> Dict[str, float]:
         """
@@ -402,22 +438,10 @@ class EnergyCalculator:
         Returns:
             Slovník s klasifikáciou
         """
-        energy_class = "G"  # Predvolená najhoršia trieda
-        
-        for class_name, class_data in self.energy_classes.items():
-            if specific_primary_energy <= class_data["max_consumption"]:
-                energy_class = class_name
-                break
-        
-        class_info = self.energy_classes[energy_class]
-        
-        return {
-            'energy_class': energy_class,
-            'specific_primary_energy': specific_primary_energy,
-            'class_description': class_info['description'],
-            'class_color': class_info['color'],
-            'max_consumption_for_class': class_info['max_consumption']
-        }
+        # Cache platí len pre predvolené triedy; kópia, aby úprava výsledku nezmenila cache
+        if self.energy_classes is ENERGY_CLASSES:
+            return dict(_classify_default(specific_primary_energy))
+        return _classify(self.energy_classes, specific_primary_energy)
     
     def complete_building_assessment(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -429,6 +453,38 @@ class EnergyCalculator:
         Returns:
             Kompletné hodnotenie s všetkými výpočtami
         """
+        # Kľúč cache je kanonický JSON vstupu aj nastavení (zmena nastavení cache obíde);
+        # údaje, ktoré nie sú JSON, sa počítajú priamo
+        try:
+            key = json.dumps([building_data, self._settings()], sort_keys=True)
+        except (TypeError, ValueError):
+            return self._assess(building_data)
+        
+        cache = self._assessment_cache
+        cached = cache.get(key)
+        if cached is None:
+            # Výpočet z pôvodných údajov volajúceho; cache dostane vlastnú kópiu
+            assessment = self._assess(building_data)
+            cache[key] = copy.deepcopy(assessment)
+            if len(cache) > _ASSESSMENT_CACHE_SIZE:
+                cache.popitem(last=False)
+            return assessment
+        
+        cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    def _settings(self) -> Dict[str, Any]:
+        """Nastavenia kalkulátora, od ktorých závisí výsledok hodnotenia"""
+        return {
+            'thermal_constants': self.thermal_constants,
+            'energy_classes': self.energy_classes,
+            'internal_temp_heating': self.internal_temp_heating,
+            'internal_temp_cooling': self.internal_temp_cooling,
+            'climate_data': asdict(self.climate_data),
+        }
+    
+    def _assess(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Samotný výpočet kompletného hodnotenia"""
         # Extrakcia údajov
         floor_area = building_data.get('heated_area', 100)
         building_height = building_data.get('building_height', 2.7)  # m
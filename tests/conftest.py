@@ -0,0 +1,37 @@
+"""
+Spoločné pytest fixtures pre testy
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Pridanie src adresára do Python cesty
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def db_manager():
+    """Jedna databáza v pamäti pre celú session (bez diskových operácií)"""
+    from database import DatabaseManager
+    
+    return DatabaseManager(":memory:")
+
+
+@pytest.fixture(scope="session")
+def calculator():
+    """Energetický kalkulátor zdieľaný testami"""
+    from energy_calculations import EnergyCalculator
+    
+    return EnergyCalculator()
+
+
+@pytest.fixture(scope="session")
+def sample_results(calculator):
+    """Výsledky hodnotenia vzorovej budovy (počítajú sa raz za session)"""
+    from energy_calculations import create_sample_building_data
+    
+    return calculator.complete_building_assessment(create_sample_building_data())
@@ -0,0 +1,95 @@
+"""
+Rýchle smoke testy pre Energy Audit Desktop Application (spúšťa run_tests.py)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config import ENERGY_CLASSES
+
+# Bez grafického displeja (headless CI) sa GUI testy preskakujú
+NO_DISPLAY = not os.environ.get("DISPLAY") and sys.platform not in ("win32", "darwin")
+
+
+def test_config():
+    """Test konfigurácie"""
+    from config import BUILDING_TYPES, HEATING_TYPES
+    from certificate_generator import CertificateGenerator
+
+    assert len(ENERGY_CLASSES) == 8, f"Očakáva sa 8 energetických tried, nájdených {len(ENERGY_CLASSES)}"
+    assert len(BUILDING_TYPES) > 5, f"Príliš málo typov budov: {len(BUILDING_TYPES)}"
+    assert len(HEATING_TYPES) > 5, f"Príliš málo typov vykurovania: {len(HEATING_TYPES)}"
+
+
+@pytest.mark.skipif(NO_DISPLAY, reason="no display")
+def test_gui_import():
+    """Test importu GUI komponentov (bez spustenia GUI)"""
+    from main import EnergyAuditApp
+    from audit_forms import AuditFormDialog, AuditListFrame
+
+
+def test_simple_gui_import_without_tk():
+    """Import simple_audit_gui nesmie načítať tkinter (oddelený proces)"""
+    code = "import sys, simple_audit_gui; sys.exit('tkinter' in sys.modules)"
+    root = Path(__file__).parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+
+BASIC_DATA = {
+    'audit_name': 'Test audit',
+    'building_name': 'Test budova',
+    'building_type': 'Rodinný dom',
+    'total_area': 120.0,
+    'heated_area': 100.0,
+    'construction_year': 2020
+}
+
+INTEGRATION_DATA = {
+    'audit_name': 'Integračný test',
+    'building_name': 'Testovacia budova',
+    'building_type': 'Rodinný dom',
+    'total_area': 150.0,
+    'heated_area': 120.0,
+    'construction_year': 1995
+}
+
+
+def test_energy_calculator(calculator, sample_results):
+    """Klasifikácia a hodnotenie vzorovej budovy (vykurovaná plocha 120 m²)"""
+    classification = calculator.classify_energy_efficiency(150)
+    assert classification['energy_class'] == 'D', "Nesprávna trieda na hranici 150 kWh/m²rok"
+    assert classification['max_consumption_for_class'] == 150
+    
+    assert 'energy_classification' in sample_results, "Chýba energetická klasifikácia"
+    summary = sample_results['summary']
+    assert summary['energy_class'] == 'E', "Neočakávaná energetická trieda vzorovej budovy"
+    assert summary['specific_primary_energy'] == pytest.approx(150.75, abs=0.01)
+    assert sample_results['energy_classification']['energy_class'] == summary['energy_class']
+
+
+@pytest.mark.parametrize("audit_data,status", [
+    (BASIC_DATA, None),
+    (INTEGRATION_DATA, 'completed'),
+], ids=["basic", "integration"])
+def test_audit_flow(db_manager, sample_results, audit_data, status):
+    """Vytvorenie auditu (a jeho aktualizácia výsledkom hodnotenia) v databáze"""
+    # Kópie - DatabaseManager dopĺňa do slovníkov časové údaje
+    if status is None:
+        audit = db_manager.create_audit(dict(audit_data), return_row=True)
+    else:
+        update_data = {
+            'status': status,
+            'notes': f"Energetická trieda: {sample_results['summary']['energy_class']}"
+        }
+        audit = db_manager.create_and_update_audit(dict(audit_data), update_data, return_row=True)
+    
+    assert audit is not None, "Audit sa nepodarilo vytvoriť"
+    assert audit['audit_name'] == audit_data['audit_name'], "Nesprávny názov auditu"
+    assert audit['created_date'] is not None
+    if status is not None:
+        assert audit['status'] == status
+        assert audit['notes'] == "Energetická trieda: E"